@@ -0,0 +1,68 @@
+'''Shared HTTP keep-alive session for Alpaca device calls.
+alpyca issues every property read/write with a bare requests.get/put, i.e. a new TCP connection per call.
+enable_keepalive() routes those calls through one pooled requests.Session so they reuse open connections.'''
+
+import sys
+import logging
+import threading
+import importlib
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# alpyca modules that call requests.get/put directly
+ALPACA_HTTP_MODULES = ('alpaca.device', 'alpaca.camera')
+
+_session = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    '''Get the process-wide keep-alive session (created on first use)'''
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            # Only retry failed connects - never re-send a request the device may already have acted on
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=1, read=False))
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+class _SessionRequests:
+    '''Stand-in for the requests module inside alpyca - get/put go through the shared session, everything else is unchanged'''
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def get(self, *args, **kwargs):
+        return self._session.get(*args, **kwargs)
+
+    def put(self, *args, **kwargs):
+        return self._session.put(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def enable_keepalive() -> bool:
+    '''Route alpyca's HTTP calls through the shared session. Safe to call more than once.'''
+    patched = False
+    for module_name in ALPACA_HTTP_MODULES:
+        try:
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        except ImportError:
+            continue
+        current = getattr(module, 'requests', None)
+        if isinstance(current, _SessionRequests):
+            patched = True
+            continue
+        if current is requests:
+            module.requests = _SessionRequests(get_session())
+            logger.debug(f"Alpaca HTTP keep-alive enabled for {module_name}")
+            patched = True
+    return patched
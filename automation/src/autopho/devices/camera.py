@@ -1,8 +1,12 @@
 import time
 import logging
+import itertools
+import tempfile
 from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
-from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .alpaca_session import enable_keepalive, get_session
 
 try:
     from alpaca.camera import Camera
@@ -14,6 +18,23 @@ logger = logging.getLogger(__name__)
 
 class CameraError(Exception):
     pass
+
+# Alpaca ImageBytes transport - 11 x int32 metadata header, then raw pixel data
+IMAGEBYTES_MIME = 'application/imagebytes'
+IMAGEBYTES_HEADER_LEN = 44
+IMAGEBYTES_CHUNK = 1 << 20
+# Alpaca ImageArrayElementTypes -> numpy dtypes (pixel data is little-endian)
+IMAGEBYTES_DTYPES = {
+    1: np.dtype('<i2'),     # Int16
+    2: np.dtype('<i4'),     # Int32
+    3: np.dtype('<f8'),     # Double
+    4: np.dtype('<f4'),     # Single
+    5: np.dtype('<u8'),     # UInt64
+    6: np.dtype('u1'),      # Byte
+    7: np.dtype('<i8'),     # Int64
+    8: np.dtype('<u2'),     # UInt16
+    9: np.dtype('<u4'),     # UInt32
+}
 # Set up camera device class
 class CameraDevice:
     
@@ -24,7 +45,20 @@ class CameraDevice:
         self.config = config
         self.role = config.get('role', 'unknown')
         self.connected = False
-        self._stat_history = deque(maxlen=25) # keep last 25 frames data
+        # Rolling p95 baseline over the last 25 frames - ring buffer with a running sum, O(1) per frame
+        self._hist_buf = np.zeros(25)
+        self._hist_sum = 0.0
+        self._hist_n = 0
+        self._hist_idx = 0
+        self._static_props: Dict[str, Any] = {}     # properties that never change for a device (name, sensor size etc)
+        self._last_roi: Optional[Tuple[int, int, int]] = None     # (binning, num_x, num_y) last written to the camera
+        self._roi_table: Dict[int, Tuple[int, int]] = {}    # binning -> (num_x, num_y)
+        self._kth_cache: Dict[int, Tuple[int, int]] = {}    # pixel count -> (median, p95) partition indices
+        self._imagebytes_supported = True   # cleared once the server answers an ImageBytes request with JSON
+        # Frame stats run on a single background worker so they overlap the next exposure (created on first frame,
+        # released on disconnect)
+        self._stats_pool: Optional[ThreadPoolExecutor] = None
+        self.last_stats_future: Optional[Future] = None
         
     def connect(self):
         '''Connect to the camera and initialise coolers (.Connected is reliable here)'''
@@ -33,10 +67,19 @@ class CameraDevice:
                 self.camera.Connected = True
                 time.sleep(0.5)
                 
+            self._last_roi = None       # camera may have reset its ROI - write it again on next capture
+            self._imagebytes_supported = True   # new connection - the server may be a different one
             self.connected = self.camera.Connected
             if self.connected:
                 logger.info(f"Connected to {self.role} camera: {self.name} (ID: {self.device_id})")
                 
+                # Sensor size is static - work out the ROI for each supported binning now, off the exposure path
+                try:
+                    for binning in (1, 2, 3, 4):
+                        self._roi_dims(binning)
+                except Exception as e:
+                    logger.debug(f"Could not precompute ROI table: {e}")
+                
                 #Initialize cooler after camera connection
                 self.initialize_cooler()
             
@@ -47,6 +90,10 @@ class CameraDevice:
         
     def disconnect(self):
         # Disconnect from the cameras
+        # Release the stats worker - a frame already queued still gets its stats, a reconnect starts a new pool
+        if self._stats_pool is not None:
+            self._stats_pool.shutdown(wait=False)
+            self._stats_pool = None
         try:
             if self.camera and self.connected:
                 self.camera.Connected = False
@@ -58,6 +105,19 @@ class CameraDevice:
             logger.error(f"Failed to disconnect camera {self.name}: {e}")
             return False
         
+    def get_static_properties(self) -> Dict[str, Any]:
+        '''Get the camera properties that never change (read once via Alpaca, then cached)'''
+        if not self._static_props:
+            cam = self.camera
+            self._static_props = {
+                'camera_name': cam.Name,
+                'size_x': getattr(cam, 'CameraXSize', 'None'),
+                'size_y': getattr(cam, 'CameraYSize', 'None'),
+                'pixel_size_x': getattr(cam, 'PixelSizeX', None),
+                'pixel_size_y': getattr(cam, 'PixelSizeY', None),
+            }
+        return self._static_props
+        
     def get_camera_settings(self) -> Dict[str, Any]:
         '''Get information about the camera'''
         if not self.connected:
@@ -66,17 +126,14 @@ class CameraDevice:
         # If connected, create and return the info dictionary
         try:
             cam = self.camera
+            settings.update(self.get_static_properties())
+            # Only the properties that can change between frames are read live
             settings.update({
-                'camera_name': cam.Name,
                 'camera_id': self.device_id,
                 'camera_state': getattr(cam, 'CameraState', 'Unknown'),
                 'bin_x': getattr(cam, 'BinX', 'None'),
                 'bin_y': getattr(cam, 'BinY', 'None'),
-                'size_x': getattr(cam, 'CameraXSize', 'None'),
-                'size_y': getattr(cam, 'CameraYSize', 'None'),
                 'gain': getattr(cam, 'Gain', None),
-                'pixel_size_x': getattr(cam, 'PixelSizeX', None),
-                'pixel_size_y': getattr(cam, 'PixelSizeY', None),
                 'ccd_temperature': getattr(cam, 'CCDTemperature', None),
                 'cooler_on': getattr(cam, 'CoolerOn', None)
             })
@@ -85,6 +142,17 @@ class CameraDevice:
             
         return settings
     
+    def _roi_dims(self, binning: int) -> Tuple[int, int]:
+        '''Get the full-frame (NumX, NumY) for a binning level - computed once per binning from the cached sensor size'''
+        if binning not in self._roi_table:
+            static_props = self.get_static_properties()
+            max_x = static_props['size_x']     # max value from Alpaca function call (cached)
+            max_y = static_props['size_y']     # max value from Alpaca function call (cached)
+            binned_x = (max_x // binning) // 8 * 8      # Ensure integer multiple of 8
+            binned_y = (max_y // binning) // 2 * 2      # Ensure integer multiple of 2
+            self._roi_table[binning] = (binned_x, binned_y)
+        return self._roi_table[binning]
+    
     def set_roi_and_binning(self, binning: int = None) -> bool:
         '''Set the region of interest (roi) and binning for the camera'''
         if not self.connected:
@@ -96,42 +164,169 @@ class CameraDevice:
             if binning is None:
                 binning = self.config.get('default_binning', 4)
                 
+            binned_x, binned_y = self._roi_dims(binning)
+            # Skip the six Alpaca writes if the camera already has this ROI/binning
+            target = (binning, binned_x, binned_y)
+            if self._last_roi == target:
+                return True
+            
+            #Alpaca function calls/settings
+            self._last_roi = None
             cam.BinX = binning
             cam.BinY = binning
-            max_x = cam.CameraXSize     # max value from Alpaca function call
-            max_y = cam.CameraYSize     # max value from Alpaca function call
-            binned_x = (max_x // binning) // 8 * 8      # Ensure integer multiple of 8
-            binned_y = (max_y // binning) // 2 * 2      # Ensure integer multiple of 2
-            #Alpaca function calls/settings
             cam.StartX = 0
             cam.StartY = 0
             cam.NumX = binned_x
             cam.NumY = binned_y
+            self._last_roi = target
             
             logger.debug(f"ROI Set: {binned_x}x{binned_y} at {binning}x{binning} binning")
             return True
         except Exception as e:
             logger.error(f"Failed to set ROI and binning: {e}")
             
+    @staticmethod
+    def _read_into(raw, buffer) -> None:
+        '''Fill buffer from the raw HTTP stream in 1 MB chunks (no intermediate copy of the whole body)'''
+        view = memoryview(buffer).cast('B')
+        got = 0
+        while got < len(view):
+            n = raw.readinto(view[got:got + IMAGEBYTES_CHUNK])
+            if not n:
+                raise CameraError(f"ImageBytes download truncated ({got}/{len(view)} bytes)")
+            got += n
+    
+    def _allocate_frame(self, shape: Tuple[int, int], dtype: np.dtype) -> np.ndarray:
+        '''Allocate the frame buffer - in RAM, or file-backed if image_staging_dir is set in devices.yaml'''
+        staging_dir = self.config.get('image_staging_dir')
+        if not staging_dir:
+            return np.empty(shape, dtype=dtype)
+        # Anonymous temp file: the OS removes it once the mapping (i.e. the last view of the frame) is released,
+        # so frames still being used by the stats worker or FITS writer are never overwritten
+        with tempfile.TemporaryFile(dir=staging_dir, prefix=f"frame_{self.device_id}_") as fh:
+            return np.memmap(fh, dtype=dtype, mode='w+', shape=shape)
+    
+    def _read_image_bytes(self) -> np.ndarray:
+        '''Download the image via Alpaca's binary ImageBytes transport (much faster than the JSON ImageArray)'''
+        address = self.config.get('address', '127.0.0.1:11113')
+        url = f"http://{address}/api/v1/camera/{self.device_id}/imagearray"
+        with get_session().get(url, headers={'Accept': IMAGEBYTES_MIME}, stream=True,
+                          timeout=self.config.get('download_timeout', 60.0)) as resp:
+            resp.raise_for_status()
+            # Server may ignore the Accept header and reply with JSON - let the caller fall back
+            if IMAGEBYTES_MIME not in resp.headers.get('Content-Type', ''):
+                self._imagebytes_supported = False      # won't change for this connection - stop asking
+                raise CameraError(f"ImageBytes not supported by server (Content-Type: {resp.headers.get('Content-Type')})")
+            raw = resp.raw
+            raw.decode_content = True
+            
+            header = np.empty(IMAGEBYTES_HEADER_LEN // 4, dtype='<i4')
+            self._read_into(raw, header)
+            error_number, data_start = int(header[1]), int(header[4])
+            if data_start > IMAGEBYTES_HEADER_LEN:
+                self._read_into(raw, bytearray(data_start - IMAGEBYTES_HEADER_LEN))
+            if error_number != 0:
+                raise CameraError(f"ImageBytes error {error_number}: {raw.read().decode('utf-8', 'replace')}")
+            transmission_type, rank, dim1, dim2 = (int(v) for v in header[6:10])
+            if rank != 2 or transmission_type not in IMAGEBYTES_DTYPES:
+                raise CameraError(f"Unsupported ImageBytes layout (rank={rank}, type={transmission_type})")
+            
+            # Pixels stream straight into the array that is handed on to stats/FITS - one allocation, no copies.
+            # Same element order as the JSON ImageArray ([x][y], y fastest) - transpose to (rows, cols)
+            pixels = self._allocate_frame((dim1, dim2), IMAGEBYTES_DTYPES[transmission_type])
+            self._read_into(raw, pixels)
+        return np.asarray(pixels).transpose()
+    
+    def _read_image_array(self) -> np.ndarray:
+        '''Read the completed exposure from the camera, preferring the binary transport
+        (unless the server has already said it doesn't support it on this connection)'''
+        if self._imagebytes_supported:
+            try:
+                return self._read_image_bytes()
+            except Exception as e:
+                logger.debug(f"ImageBytes download failed ({e}), falling back to JSON ImageArray")
+        # Nested [x][y] list of ints - flatten straight into a pre-sized array (single allocation, single pass)
+        raw = self.camera.ImageArray
+        dim1, dim2 = len(raw), len(raw[0])
+        flat = np.fromiter(itertools.chain.from_iterable(raw), dtype=np.int32, count=dim1 * dim2)
+        return flat.reshape(dim1, dim2).transpose()
+            
+    def _push_p95(self, value: float):
+        '''Add a frame's p95 to the rolling baseline, replacing the oldest once the buffer is full'''
+        old = self._hist_buf[self._hist_idx]
+        self._hist_buf[self._hist_idx] = value
+        self._hist_sum += value - old
+        self._hist_idx = (self._hist_idx + 1) % len(self._hist_buf)
+        self._hist_n = min(self._hist_n + 1, len(self._hist_buf))
+    
     def _rolling_baseline(self):
         '''Update rolling baseline for image array statistics (min, max, avg counts etc)'''
-        if not self._stat_history:
+        if not self._hist_n:
             return None
-        return np.mean(self._stat_history)
+        return self._hist_sum / self._hist_n
+    
+    def _stat_indices(self, n: int) -> Tuple[int, int]:
+        '''Order-statistic indices (median, p95) for an n-pixel frame - validated once per frame size, then cached'''
+        if n not in self._kth_cache:
+            if n <= 0:
+                raise CameraError("Cannot compute stats on an empty image")
+            self._kth_cache[n] = (n // 2, min(int(n * 0.95), n - 1))
+        return self._kth_cache[n]
     
     def image_array_stats(self, image_array: np.ndarray) -> dict:
         """Return summary stats for a captured image array"""
+        # Distribution stats only feed the log and the sky-drop check, so a regular subsample (every Nth
+        # pixel in each axis, from devices.yaml) is plenty and 16x less work at the default of 4.
+        # min/max stay on the full frame so saturated/dead pixels are still reported.
+        step = max(1, int(self.config.get('stats_subsample', 4)))
+        # One private contiguous copy of the subsample - every reduction below then runs as a tight C loop with
+        # the GIL released, so this can sit on the stats worker without stalling exposure polling
+        flat = np.array(image_array[::step, ::step], order='C', copy=True).ravel()
+        n = flat.size
+        k_med, k_p95 = self._stat_indices(n)
+        # One O(n) partial partition gives both the median and p95 (instead of two full sorts) - in place, it's our copy
+        flat.partition([k_med, k_p95])
+        # Mean/std from one sum and one sum-of-squares, accumulated exactly in 64-bit (integer pixels)
+        # rather than np.std's float64 copy of the frame plus a second pass over the deviations
+        acc_dtype = np.float64 if flat.dtype.kind == 'f' else (np.uint64 if flat.dtype.kind == 'u' else np.int64)
+        total = flat.sum(dtype=acc_dtype)
+        total_sq = np.einsum('i,i->', flat, flat, dtype=acc_dtype)
+        mean = float(total) / n
+        variance = max(float(total_sq) / n - mean * mean, 0.0)
         stats =  {
             "min": int(np.min(image_array)),
             "max": int(np.max(image_array)),
-            "mean": float(np.mean(image_array)),
-            "median": float(np.median(image_array)),
-            "p95": float(np.percentile(image_array, 95)),
-            "std": float(np.std(image_array))
+            "mean": mean,
+            "median": float(flat[k_med]),
+            "p95": float(flat[k_p95]),
+            "std": variance ** 0.5
         }
-        self._stat_history.append(stats["p95"])
+        self._push_p95(stats["p95"])
         return stats
     
+    def _report_frame_stats(self, image_array: np.ndarray) -> dict:
+        """Compute frame stats, compare against the rolling baseline and log them (runs on the stats worker)"""
+        try:
+            baseline = self._rolling_baseline()     # Update baseline stats
+            stats = self.image_array_stats(image_array)     # Get current frame stats
+            # Print image ADU stats to log/console
+            drop_info = ""
+            if baseline:
+                drop_ratio = stats["p95"] / baseline
+                drop_info = f", drop vs baseline: {drop_ratio:.2f} x"
+            logger.info(
+                f"Image captured: {image_array.shape[1]}x{image_array.shape[0]}, "
+                f"range: {stats['min']}-{stats['max']}, "
+                f"mean: {stats['mean']:.1f}, median: {stats['median']:.1f}, "
+                f"p95: {stats['p95']:.1f}, std: {stats['std']:.1f}{drop_info}"
+            )
+            if baseline and drop_ratio < 0.4:       # If the counts drop by more than 40%, log a warning (perhaps dome has closed, perhaps awful clouds)
+                logger.warning(f"    Significant drop detected - possible dome closure or heavy clouds")
+            return stats
+        except Exception as e:
+            logger.warning(f"Failed to compute image stats: {e}")
+            return {}
+    
     def capture_image(self, exposure_time: float, binning: int = None, gain: int = None, light: bool = True) -> Optional[np.ndarray]:
         '''Capture an image using the camera and return the image array'''
         if not self.connected:
@@ -142,6 +337,7 @@ class CameraDevice:
         
             if not cam.Connected:
                 logger.warning(f"Camera {self.name} not connected, attempting reconnection")
+                self._last_roi = None
                 cam.Connected = True
                 time.sleep(0.5)
                 
@@ -198,24 +394,28 @@ class CameraDevice:
                 if image_ready:
                     break
                 
-                # also try camera state
-                try:
-                    cs = cam.CameraState
-                    state_name = cs.name if hasattr(cs, 'Name') else str(cs)
-                except Exception as e:
-                    state_name = None
-                    
-                if state_name and any(kw in state_name.lower() for kw in ("idle", "reading", "download")):
-                    break
+                elapsed = time.time() - start_time
+                remaining = max(0.0, exposure_time - elapsed)
+                # also try camera state (only once the exposure should be nearly done - saves an Alpaca call per poll)
+                if remaining < 1.0:
+                    try:
+                        cs = cam.CameraState
+                        state_name = cs.name if hasattr(cs, 'Name') else str(cs)
+                    except Exception as e:
+                        state_name = None
+                        
+                    if state_name and any(kw in state_name.lower() for kw in ("idle", "reading", "download")):
+                        break
             
-                if (time.time() - start_time) > image_timeout:
+                if elapsed > image_timeout:
                     logger.error(f"Exposure timeout after {(time.time()-start_time):.1f} s (timeout={image_timeout} s). Attempting AbortExposure.")
                     try:
                         cam.AbortExposure()
                     except Exception as e:
                         logger.warning(f"AbortExposure failed: {e}")
                     raise CameraError(f"Exposure timeout after {(time.time()-start_time):.1f} s")
-                time.sleep(image_poll_interval)
+                # Back off while far from the end of the exposure, then tight-poll for the readout
+                time.sleep(min(max(remaining * 0.2, image_poll_interval), 2.0))
             
             ### DEBUGGING CAMERA STATE IN VARIOUS PLACES ###
             try: 
@@ -240,22 +440,11 @@ class CameraDevice:
                 # time.sleep(min(0.5, exposure_time / 10))
                 
             logger.debug('Exposure complete, reading image...')
-            image_array = np.array(cam.ImageArray).transpose()      # Convert image array to numpy array for summary statistics
-            baseline = self._rolling_baseline()     # Update baseline stats
-            stats = self.image_array_stats(image_array)     # Get current frame stats
-            # Print image ADU stats to log/console
-            drop_info = ""
-            if baseline:
-                drop_ratio = stats["p95"] / baseline
-                drop_info = f", drop vs baseline: {drop_ratio:.2f} x"
-            logger.info(
-                f"Image captured: {image_array.shape[1]}x{image_array.shape[0]}, "
-                f"range: {stats['min']}-{stats['max']}, "
-                f"mean: {stats['mean']:.1f}, median: {stats['median']:.1f}, "
-                f"p95: {stats['p95']:.1f}, std: {stats['std']:.1f}{drop_info}"
-            )
-            if baseline and drop_ratio < 0.4:       # If the counts drop by more than 40%, log a warning (perhaps dome has closed, perhaps awful clouds)
-                logger.warning(f"    Significant drop detected - possible dome closure or heavy clouds")
+            image_array = self._read_image_array()      # Numpy array (rows, cols) for summary statistics
+            # Stats/baseline check run in the background - callers can join via last_stats_future if needed
+            if self._stats_pool is None:
+                self._stats_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"camstats-{self.device_id}")
+            self.last_stats_future = self._stats_pool.submit(self._report_frame_stats, image_array)
             
             # logger.info(f"Image captured: {image_array.shape[1]}x{image_array.shape[0]}, "
             #             f"range: {np.min(image_array)}-{np.max(image_array)}")
@@ -332,9 +521,36 @@ class CameraManager:
         if not ALPACA_AVAILABLE:
             raise CameraError(f"Alpaca Library not available. Please install")
         
+        enable_keepalive()      # all Alpaca property calls share one keep-alive HTTP session
         self.cameras = {}
         self.discovered_devices = []
         
+    def _probe_device(self, address: str, device_id: int) -> Optional[Dict[str, Any]]:
+        '''Probe a single Alpaca camera device ID, returning its discovery info (or None if nothing found)'''
+        try:
+            camera_obj = Camera(address, device_id)
+            try:
+                name = camera_obj.Name
+            except:
+                try:
+                    camera_obj.Connected = True
+                    time.sleep(0.5)
+                    name = camera_obj.Name
+                    camera_obj.Connected = False
+                except:
+                    logger.warning(f"Could not get name for camera device {device_id}")
+                    return None
+            
+            logger.info(f"Found camera device {device_id}: {name}")
+            return {
+                'device_id': device_id,
+                'name': name,
+                'camera_obj': camera_obj
+            }
+        except Exception as e:
+            logger.debug(f"No camera found at device ID {device_id}: {e}")
+            return None
+        
     def discover_cameras(self, camera_configs: Dict[str, Dict[str, Any]]):
         '''Discover which cameras are currently available using address from devices.yaml and 2 device IDs (0, 1)
         Should be 2 cameras - a main photometry cam and a spectroscopy guide cam'''
@@ -344,31 +560,10 @@ class CameraManager:
         # Get camera info from devices.yaml config
         first_config = next(iter(camera_configs.values()))
         address = first_config.get('address', '127.0.0.1:11113')
-        # Get info about each camera
-        for device_id in [0, 1]:
-            try:
-                camera_obj = Camera(address, device_id)
-                try:
-                    name = camera_obj.Name
-                except:
-                    try:
-                        camera_obj.Connected = True
-                        time.sleep(0.5)
-                        name = camera_obj.Name
-                        camera_obj.Connected = False
-                    except:
-                        logger.warning(f"Could not get name for camera device {device_id}")
-                        continue
-                self.discovered_devices.append({
-                    'device_id': device_id,
-                    'name': name,
-                    'camera_obj': camera_obj
-                })
-                
-                logger.info(f"Found camera device {device_id}: {name}")
-                
-            except Exception as e:
-                logger.debug(f"No camera found at device ID {device_id}: {e}")
+        # Get info about each camera - probe both device IDs at once rather than one after the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda device_id: self._probe_device(address, device_id), [0, 1]))
+        self.discovered_devices.extend(device for device in results if device is not None)
         # Check for missing camera roles - should be 'main' and 'guide', from devices.yaml        
         missing_roles = []
         for role, config in camera_configs.items():
@@ -469,6 +664,7 @@ class CameraManager:
         if camera.connected:
             try:
                 cam = camera.camera
+                static_props = camera.get_static_properties()
                 status.update({
                     'camera_state': getattr(cam, 'CameraState', 'Unknown'),
                     'temperature': getattr(cam, 'CCDTemperature', None),
@@ -476,8 +672,8 @@ class CameraManager:
                     'gain': getattr(cam, 'Gain', None),
                     'binning_x': getattr(cam, 'BinX', None),
                     'binning_y': getattr(cam, 'BinY', None),
-                    'size_x': getattr(cam, 'CameraXSize', None),
-                    'size_y': getattr(cam, 'CameraYSize', None)
+                    'size_x': static_props['size_x'],
+                    'size_y': static_props['size_y']
                 })
             except Exception as e:
                 status['error'] = f"Failed to get camera details: {e}"
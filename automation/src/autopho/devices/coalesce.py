@@ -0,0 +1,42 @@
+'''Request coalescing for read-only device status calls.
+When the GUI and the automation scripts ask a driver for its status at the same time, only the first caller
+talks to Alpaca - everyone who arrives while that call is in flight waits for, and shares, its result.'''
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class RequestCoalescer:
+    '''Share a single in-flight call between concurrent callers (one coalescer per status method)'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Optional[Future] = None
+
+    def run(self, fn: Callable[[], T]) -> T:
+        '''Call fn(), or if another thread is already running it, wait for and return that call's result'''
+        with self._lock:
+            future = self._in_flight
+            leader = future is None
+            if leader:
+                future = self._in_flight = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish()
+            future.set_exception(e)
+            raise
+        self._finish()
+        future.set_result(result)
+        return result
+
+    def _finish(self):
+        # Later callers start a fresh call - only requests that overlap the in-flight one are coalesced
+        with self._lock:
+            self._in_flight = None
@@ -2,7 +2,13 @@
 
 import time
 import logging
-from typing import Dict, Any
+from enum import IntEnum
+from typing import Dict, Any, Optional
+
+import requests
+
+from ..alpaca_session import enable_keepalive
+from ..coalesce import RequestCoalescer
 
 try:
     from alpaca.covercalibrator import CoverCalibrator
@@ -16,22 +22,53 @@ logger = logging.getLogger(__name__)
 class AlpacaCoverError(Exception):
     pass
 
+class CoverState(IntEnum):
+    '''Cover states reported by the driver's "coverstatus" SupportedAction'''
+    ERROR = -1
+    UNKNOWN = 0
+    CLOSED = 1
+    OPEN = 2
+    
+    @property
+    def label(self) -> str:
+        '''Display string used by get_cover_state / get_cover_info ("Open", "Closed" etc)'''
+        return self.name.capitalize()
+
+# Raw "coverstatus" codes (returned as strings) -> CoverState
+COVER_STATUS_CODES = {'1': CoverState.CLOSED, '2': CoverState.OPEN}
+
 # Setup main driver class
 class AlpacaCoverDriver:
     def __init__(self):
         # Ensure alpyca is installed
         if not ALPACA_AVAILABLE:
             raise AlpacaCoverError("Alpaca library not available. Please install.")
+        enable_keepalive()      # all Alpaca property calls share one keep-alive HTTP session
         self.config = None
+        self.cover = None
+        self._state_cache = (None, 0.0)     # (last CoverState read, time.monotonic() of that read)
+        self._status_coalescer = RequestCoalescer()
         
-    def _connect_temp(self):
-        '''Temporarily connect to the Cover'''
-        address = self.config.get('address', '127.0.0.1:11112')
-        device_number = self.config.get('device_number', 0)
-        cover = CoverCalibrator(address=address, device_number=device_number)
-        cover.Connect()
-        time.sleep(2)
-        return cover
+    def _get_cover(self):
+        '''Get the cached Cover handle, connecting (and waiting for the driver) only on first use'''
+        if self.cover is None:
+            address = self.config.get('address', '127.0.0.1:11112')
+            device_number = self.config.get('device_number', 0)
+            cover = CoverCalibrator(address=address, device_number=device_number)
+            cover.Connect()
+            # Driver needs a moment after Connect() - only paid when the handle is (re)built, never per call
+            time.sleep(self.config.get('connect_settle_time', 2.0))
+            self.cover = cover
+        return self.cover
+    
+    def _with_cover(self, action):
+        '''Run action(cover) on the cached handle - if it fails, rebuild the handle and try once more'''
+        try:
+            return action(self._get_cover())
+        except Exception as e:
+            logger.debug(f"Cover call failed ({e}) - reconnecting")
+            self.cover = None
+            return action(self._get_cover())
     
     def connect(self, config: Dict[str, Any]) -> bool:
         try:
@@ -41,7 +78,9 @@ class AlpacaCoverDriver:
             
             logger.debug(f"Testing cover connection at {address}, device {device_number}")
             
-            test_cover = self._connect_temp()
+            # The handle connected here is kept and reused by every later call
+            self.cover = None
+            test_cover = self._get_cover()
             # .Connected status is notoriously unreliable - using another attribute to confirm connection
             # If we can get the .Name, we are functionally connected to the Cover driver.
             try:
@@ -50,6 +89,7 @@ class AlpacaCoverDriver:
                 return True
             except Exception as e:
                 logger.error(f"Cover connection test failed: {e}")
+                self.cover = None
                 return False
         except Exception as e:
             logger.error(f"Cover connection error: {e}")
@@ -58,26 +98,74 @@ class AlpacaCoverDriver:
     def disconnect(self) -> bool:
         '''Placeholder if required later'''
         # Generally not required to formally disconnect from the cover driver - will happen automatically when program ends
+        self.cover = None
+        self._invalidate_state()
         return True
     
-    def get_cover_state(self) -> str:
-        '''Return status (open or closed or error) of the covers, based on the in-built SupportedAction "coverstatus"'''
+    def _invalidate_state(self):
+        '''Forget the cached cover state - called whenever a move/halt command is sent'''
+        self._state_cache = (None, 0.0)
+    
+    def read_cover_state(self, max_age: Optional[float] = None) -> CoverState:
+        '''Return the cover state as a CoverState, based on the in-built SupportedAction "coverstatus".
+        A state read within max_age seconds (default state_cache_ttl from devices.yaml) is reused, as long as
+        no move has been commanded since. Pass max_age=0 to force a fresh read.'''
         if not self.config:
-            return 'Unknown'
+            return CoverState.UNKNOWN
+        
+        if max_age is None:
+            max_age = self.config.get('state_cache_ttl', 0.5)
+        cached_state, read_at = self._state_cache
+        if cached_state is not None and time.monotonic() - read_at < max_age:
+            return cached_state
         
         try:
-            cover = self._connect_temp()
-            status_code = cover.Action("coverstatus", "")
-            # 1 (as a string) = Closed, 2 (as a string) = Open
-            if status_code == '1':
-                return "Closed"
-            elif status_code == '2':
-                return "Open"
-            else:
-                logger.warning(f"Unknown cover status code: {status_code}")
+            # Concurrent callers (GUI + scripts) share one in-flight Alpaca read
+            status_code = self._status_coalescer.run(lambda: self._with_cover(lambda cover: cover.Action("coverstatus", "")))
         except Exception as e:
             logger.error(f"Failed to get cover status: {e}")
-            return "Error"
+            return CoverState.ERROR
+        # 1 (as a string) = Closed, 2 (as a string) = Open
+        state = COVER_STATUS_CODES.get(status_code, CoverState.UNKNOWN)
+        if state is CoverState.UNKNOWN:
+            logger.warning(f"Unknown cover status code: {status_code}")
+        else:
+            self._state_cache = (state, time.monotonic())
+        return state
+    
+    def get_cover_state(self) -> str:
+        '''Return status (open or closed or error) of the covers as a display string'''
+        return self.read_cover_state().label
+            
+    def _send_command(self, command_name: str, action) -> bool:
+        '''Send a move command, retrying connection failures with a bounded backoff (retry_delays in devices.yaml).
+        Each retry rebuilds the cover handle and re-sends only the command - the caller re-polls the state afterwards.
+        Driver errors (e.g. cover already in its Error state) aren't transient, so they fail at once without retrying'''
+        delays = [0.0] + list(self.config.get('retry_delays', [0.5, 1.0, 2.0]))
+        for attempt, delay in enumerate(delays, start=1):
+            time.sleep(delay)
+            self._invalidate_state()
+            try:
+                action(self._get_cover())
+                return True
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                logger.warning(f"{command_name} attempt {attempt}/{len(delays)} failed: {e}")
+                self.cover = None
+            except Exception as e:
+                logger.error(f"{command_name} failed: {e}")
+                return False
+        return False
+    
+    def _wait_for_state(self, target: CoverState) -> CoverState:
+        '''Poll the cover status until it reaches target or operation_timeout expires - returns the last state read'''
+        timeout = self.config.get('operation_timeout', 30.0)
+        poll_interval = self.config.get('state_poll_interval', 0.25)
+        deadline = time.monotonic() + timeout
+        state = self.read_cover_state(max_age=0)
+        while state != target and time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            state = self.read_cover_state(max_age=0)
+        return state
             
     def open_cover(self) -> bool:
         '''Open the covers, if they are not already open'''
@@ -87,50 +175,37 @@ class AlpacaCoverDriver:
             return False
         try:
             # Check status - if already open, skip and return True
-            current_state = self.get_cover_state()
-            if current_state == "Open":
+            current_state = self.read_cover_state()
+            if current_state == CoverState.OPEN:
                 logger.debug("Cover already open")
                 return True
             # If status is in error, log error and return False
-            elif current_state == "Error":
+            elif current_state == CoverState.ERROR:
                 logger.error("Cover in error state - cannot open")
                 return False
             # Otherwise open the covers
             logger.debug("Opening cover...")
-            cover = self._connect_temp()
-            
-            # Alpaca function call
-            cover.OpenCover()
-            
-            # Max timeout from devices.yaml (not currently implemented)
-            operation_timeout = self.config.get('operation_timeout', 30.0)
-            # Settle/wait time from devices.yaml - time to allow the covers to open
-            settle_time = self.config.get('settle_time', 15.0)
+            # Alpaca function call (transient connection failures are retried with backoff)
+            if not self._send_command("OpenCover", lambda cover: cover.OpenCover()):
+                logger.error("Cover open failed - OpenCover could not be sent")
+                return False
             
-            logger.debug(f"Waiting {settle_time} s for cover to open")
-            time.sleep(settle_time)
+            # Wait until the covers report Open (or operation_timeout from devices.yaml expires)
+            logger.debug(f"Waiting up to {self.config.get('operation_timeout', 30.0)} s for cover to open")
+            final_state = self._wait_for_state(CoverState.OPEN)
             
             # Check final status, if Open, log and return True, otherwise still return True but log warning to manually check
-            final_state = self.get_cover_state()
-            if final_state == "Open":
+            if final_state == CoverState.OPEN:
                 logger.debug("Cover opened successfully")
                 return True
             else:
-                logger.warning(f"Cover operation completed but state is: {final_state}")
+                logger.warning(f"Cover operation completed but state is: {final_state.label}")
                 logger.warning("Manual verification recommended")
                 return True
             
         except Exception as e:
-            # If opening fails, try again (connection can be finicky)
-            try:
-                logger.debug("Retrying cover open...")
-                cover = self._connect_temp()
-                cover.OpenCover()
-                time.sleep(self.config.get('settle_time', 15.0))
-                logger.warning("Cover retry completed - manual verification recommended")
-                return True
-            except Exception as retry_e:
-                logger.error(f"Cover open return failed: {retry_e}")
+            logger.error(f"Failed to open cover: {e}")
+            return False
     
     
     def close_cover(self) -> bool:
@@ -140,30 +215,27 @@ class AlpacaCoverDriver:
             return False
         try:
             # Get current status - if already closed, skip and return True
-            current_state = self.get_cover_state()
-            if current_state == "Closed":
+            current_state = self.read_cover_state()
+            if current_state == CoverState.CLOSED:
                 logger.info("Cover already closed")
                 return True
 
             # Otherwise, close the covers
             logger.debug("Closing cover...")
-            cover = self._connect_temp()
-            
-            # Alpaca function call
-            cover.CloseCover()
-            # Get wait time from devices.yaml
-            settle_time = self.config.get('settle_time', 15.0)
-            
-            logger.debug(f"Waiting {settle_time} s for cover to close...")
-            time.sleep(settle_time)
+            # Alpaca function call (transient connection failures are retried with backoff)
+            if not self._send_command("CloseCover", lambda cover: cover.CloseCover()):
+                logger.error("Cover close failed - CloseCover could not be sent")
+                return False
+            # Wait until the covers report Closed (or operation_timeout from devices.yaml expires)
+            logger.debug(f"Waiting up to {self.config.get('operation_timeout', 30.0)} s for cover to close...")
+            final_state = self._wait_for_state(CoverState.CLOSED)
             
             # Check final status, if Closed, log and return True, otherwise still return True but log warning to manually check
-            final_state = self.get_cover_state()
-            if final_state == "Closed":
+            if final_state == CoverState.CLOSED:
                 logger.info("Cover closed successfully")
                 return True
             else:
-                logger.warning(f"Cover operation completed but state is: {final_state}")
+                logger.warning(f"Cover operation completed but state is: {final_state.label}")
                 logger.warning("Manual verification recommended")
                 return True
         except Exception as e:
@@ -177,10 +249,10 @@ class AlpacaCoverDriver:
             return False
         try:
             logger.warning("Halting cover movement...")
-            cover = self._connect_temp()
             # Alpaca function call
-            cover.HaltCover()
-            time.sleep(1)
+            self._invalidate_state()
+            # HaltCover() is synchronous in the Alpaca contract - return straight away so safety sequences aren't held up
+            self._with_cover(lambda cover: cover.HaltCover())
             return True
         except Exception as e:
             logger.error(f"Cover halt failed: {e}")
@@ -191,7 +263,7 @@ class AlpacaCoverDriver:
         if not self.config:
             return {'connected': False}
         try:
-            cover = self._connect_temp()
+            cover = self._get_cover()
             # Get current status (open, closed, error)
             current_state = self.get_cover_state()
             
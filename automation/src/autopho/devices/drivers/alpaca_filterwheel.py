@@ -5,6 +5,9 @@ import time
 import logging
 from typing import Dict, Any, Optional
 
+from ..alpaca_session import enable_keepalive
+from ..coalesce import RequestCoalescer
+
 try:
     from alpaca.filterwheel import FilterWheel
     ALPACA_AVAILABLE = True
@@ -17,6 +20,9 @@ logger = logging.getLogger(__name__)
 class AlpacaFilterWheelError(Exception):
     pass
 
+# Filter code at each wheel position, used if devices.yaml has no filter_wheel.filter_map
+DEFAULT_FILTER_CODES = ['L', 'B', 'G', 'R', 'C', 'I', 'H']
+
 # Set up main driver class
 class AlpacaFilterWheelDriver:
     
@@ -24,11 +30,15 @@ class AlpacaFilterWheelDriver:
         # Ensure alpyca is installed
         if not ALPACA_AVAILABLE:
             raise AlpacaFilterWheelError("Alpaca library not available - please install")
+        enable_keepalive()      # all Alpaca property calls share one keep-alive HTTP session
         self.filter_wheel = None
         self.config = None
         self.connected = False
         self.filter_names = []
+        self.filter_codes = list(DEFAULT_FILTER_CODES)
         self.filter_map = {}
+        self._current_position: Optional[int] = None      # last known wheel position (None = read it from the wheel)
+        self._info_coalescer = RequestCoalescer()
         
     def connect(self, config: Dict[str, Any]) -> bool:
         '''Connect to the filter wheel using info (address etc) from devices.yaml'''
@@ -39,6 +49,7 @@ class AlpacaFilterWheelDriver:
             logger.debug(f"Connecting to filter wheel at {address}, device {device_number}")
             
             self.filter_wheel = FilterWheel(address=address, device_number=device_number)
+            self._current_position = None
             
             # .Connected is generally reliable for the filter wheel, so we can use that
             # If its not showing as .Connected - set it to True
@@ -61,13 +72,10 @@ class AlpacaFilterWheelDriver:
             return False
         
     def _build_filter_map(self):
-        '''Ensures entry of filter codes can be lower or upper case'''
-        code_map = ['L', 'B', 'G', 'R', 'C', 'I', 'H']
-        self.filter_map = {}
-        
-        for i, code in enumerate(code_map[:len(self.filter_names)]):
-            self.filter_map[code.upper()] = i
-            self.filter_map[code.lower()] = i
+        '''Map upper-case filter codes to wheel positions (callers upper-case the code once before looking it up).
+        Code order comes from filter_map in devices.yaml - the same list the filter wheel GUI uses'''
+        self.filter_codes = [code.upper() for code in self.config.get('filter_map', DEFAULT_FILTER_CODES)]
+        self.filter_map = {code: i for i, code in enumerate(self.filter_codes[:len(self.filter_names)])}
             
         logger.debug(f"Filter map: {self.filter_map}")
         
@@ -81,6 +89,7 @@ class AlpacaFilterWheelDriver:
                 # Set the .Connected status to False
                 self.filter_wheel.Connected = False
                 self.connected = False
+                self._current_position = None
                 logger.info("Disconnected from filter wheel")
             return True
         except Exception as e:
@@ -90,15 +99,21 @@ class AlpacaFilterWheelDriver:
     def is_connected(self) -> bool:
         return self.connected
     
-    def get_current_position(self) -> int:
-        '''Get the current position of the filter wheel - starts from 0'''
+    def get_current_position(self, force_refresh: bool = False) -> int:
+        '''Get the current position of the filter wheel - starts from 0.
+        Returns the position cached after the last read/successful move unless force_refresh=True (or nothing is cached)'''
         if not self.connected:
             raise AlpacaFilterWheelError("Cannot get position - filter wheel not connected")
-        return self.filter_wheel.Position   # Returns the Alpaca call .Position
+        if force_refresh or self._current_position is None:
+            self._current_position = self.filter_wheel.Position   # Returns the Alpaca call .Position
+        return self._current_position
+    
+    def get_current_filter_name(self, force_refresh: bool = False) -> str:
+        '''Get the name of the filter at the current position - from the list of filter names.
+        Cached position unless force_refresh=True - pass it whenever the answer decides whether to move the wheel'''
+        return self._filter_name_at(self.get_current_position(force_refresh=force_refresh))
     
-    def get_current_filter_name(self) -> str:
-        '''Get the name of the filter at the current position - from the list of filter names'''
-        pos = self.get_current_position()
+    def _filter_name_at(self, pos: int) -> str:
         if 0 <= pos < len(self.filter_names):
             return self.filter_names[pos]
         return f"Position {pos}"
@@ -110,35 +125,43 @@ class AlpacaFilterWheelDriver:
             return False
         try:
             # Ensure code is within filter  map
-            if filter_code.upper() not in self.filter_map:
+            code = filter_code.upper()
+            target_pos = self.filter_map.get(code)
+            if target_pos is None:
                 logger.error(f"Invalid filter code: {filter_code}")
                 return False
             # Check if filter wheel is already at desired position - if it is, log and return True
-            target_pos = self.filter_map[filter_code.upper()]
-            current_pos = self.get_current_position()
+            # (always a fresh read here - the move decision must not rely on a cached position)
+            current_pos = self.get_current_position(force_refresh=True)
             
             if current_pos == target_pos:
-                logger.info(f"Filter already at {filter_code.upper()}: {self.filter_names[target_pos]}")
+                logger.info(f"Filter already at {code}: {self.filter_names[target_pos]}")
                 return True
             
-            logger.info(f"Changing filter from {self.get_current_filter_name()} to {filter_code.upper()}: {self.filter_names[target_pos]}")
+            logger.info(f"Changing filter from {self._filter_name_at(current_pos)} to {code}: {self.filter_names[target_pos]}")
             
             # If not at desired position - change the filter wheel to that position
+            self._current_position = None       # unknown while moving
             self.filter_wheel.Position = target_pos
             # Allow up to 45s, though driver will likely time itself out much quicker, usually within 5s
             timeout = time.time() + 45.0
             # Wait until the filter wheel is in the desired position
+            # Short poll interval (devices.yaml, default 0.1 s) - each poll is a cheap local HTTP read and a long
+            # interval just adds dead time after the wheel has actually arrived
+            poll_interval = self.config.get('position_poll_interval', 0.1)
             while self.filter_wheel.Position != target_pos:
                 if time.time() > timeout:
                     logger.error(f"Filter change timed out after {45} seconds")
                     return False
-                time.sleep(0.5)
+                time.sleep(poll_interval)
                 
             # Settle if required (from devices.yaml)
             settle_time = self.config.get('settle_time', 2.0)
             time.sleep(settle_time)
             
-            logger.debug(f"Filter changed successfully to {filter_code.upper()}")
+            # Wheel is known to be at target - later name/position lookups don't need another Alpaca read
+            self._current_position = target_pos
+            logger.debug(f"Filter changed successfully to {code}")
             return True
         except Exception as e:
             logger.error(f"Filter change failed: {e}")
@@ -152,12 +175,16 @@ class AlpacaFilterWheelDriver:
         '''Get information about the filter wheel (position, name, filters etc)'''
         if not self.connected:
             return {'connected': False}
+        # Concurrent callers (GUI + scripts) share one in-flight Alpaca read
+        return self._info_coalescer.run(self._read_filter_info)
+    
+    def _read_filter_info(self) -> Dict[str, Any]:
         try:
-            pos = self.get_current_position()
+            pos = self.get_current_position(force_refresh=True)
             return {
                 'connected': True,
                 'position': pos,
-                'filter_name': self.get_current_filter_name(),
+                'filter_name': self._filter_name_at(pos),
                 'total_filters': len(self.filter_names),
                 'all_filters': self.filter_names
             }
@@ -166,9 +193,8 @@ class AlpacaFilterWheelDriver:
         
     def get_filter_code_from_position(self, position: int) -> Optional[str]:
         '''Get the position number (starts from 0) from the filter code - matches to the filter code map'''
-        code_map = ['L', 'B', 'G', 'R', 'C', 'I', 'H']
-        if 0 <= position < len(code_map):
-            return code_map[position]
+        if 0 <= position < len(self.filter_codes):
+            return self.filter_codes[position]
         return None
         
     
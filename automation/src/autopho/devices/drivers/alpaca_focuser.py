@@ -3,7 +3,11 @@ Will also interact with the joint/coordinated focus_filter_manager.py which join
 
 import time
 import logging
-from typing import Dict, Any, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, Union
+
+from ..alpaca_session import enable_keepalive
+from ..coalesce import RequestCoalescer
 
 try:
     from alpaca.focuser import Focuser
@@ -23,12 +27,15 @@ class AlpacaFocuserDriver:
         # Ensure alpyca is installed
         if not ALPACA_AVAILABLE:
             raise AlpacaFocuserError("Alpaca library not available. Please install.")
+        enable_keepalive()      # all Alpaca property calls share one keep-alive HTTP session
         self.config: Dict[str, Any] | None = None
         self.focuser: Focuser | None = None
         self.connected: bool = False
         self.position: int | None = None
         self.limits: Dict[str, int | str] | None = None
         self.info: Dict[str, Any] | None = None
+        self._read_pool: Optional[ThreadPoolExecutor] = None
+        self._info_coalescer = RequestCoalescer()
         
     def connect(self, config: Dict[str, Any]) -> bool:
         '''Connect to Focuser but use is_connected() method for state, not .Connected since its unreliable'''
@@ -39,13 +46,14 @@ class AlpacaFocuserDriver:
 
         try:
             self.focuser = Focuser(address=address, device_number=device_number)
-            if not self.is_connected():
+            if not self.is_connected(probe=True):
                 self.focuser.Connected = True 
                 time.sleep(0.5)
 
-            if self.is_connected():
+            if self.is_connected(probe=True):
                 self.connected = True
-                # populate cached state
+                # populate cached state (limits are re-read once per connection)
+                self.invalidate_limits()
                 self.refresh_info()
                 return True
             else:
@@ -56,10 +64,14 @@ class AlpacaFocuserDriver:
             self.connected = False
             return False
     
-    def is_connected(self):
+    def is_connected(self, probe: bool = False):
+        '''Return connection state. Once a connection is confirmed the cached flag is trusted (no Alpaca call) -
+        a real probe only happens when probe=True, before a connection is confirmed, or after an operation has failed'''
+        if not self.focuser:
+            return False
+        if self.connected and not probe:
+            return True
         try:
-            if not self.focuser:
-                return False
             # Since .Connected is unreliable, testing a position call to see if connected
             # logic: if we can get a position, we're functionally connected to the focuser
             _ = self.focuser.Position
@@ -80,6 +92,7 @@ class AlpacaFocuserDriver:
             position = self.focuser.Position
             return position
         except Exception as e:
+            self.connected = False      # re-probe the connection on the next call
             raise AlpacaFocuserError(f"Failed to get position: {e}")
         
     def move_to_position(self, target_position):
@@ -98,10 +111,15 @@ class AlpacaFocuserDriver:
             # If save, move the Focuser to the target position via Alpaca function call
             self.focuser.Move(target_position)
             
-            # Wait while the focuser is moving to the target position
+            # Wait while the focuser is moving to the target position - poll quickly (devices.yaml, default 0.2 s)
+            # so short moves return as soon as IsMoving drops, but only log progress every 5 s
+            poll_interval = self.config.get('move_poll_interval', 0.2)
+            last_log = time.monotonic()
             while self.focuser.IsMoving:
-                logger.debug(f"    Moving focus position...currently at {self.focuser.Position}...")
-                time.sleep(5)
+                if time.monotonic() - last_log >= 5:
+                    logger.debug(f"    Moving focus position...currently at {self.focuser.Position}...")
+                    last_log = time.monotonic()
+                time.sleep(poll_interval)
             
             # Get and report the current (final) position of the focuser
             current_pos = self.get_position()
@@ -109,6 +127,7 @@ class AlpacaFocuserDriver:
             return True
         except Exception as e:
             logger.error(f"Focuser Move failed: {e}")
+            self.connected = False      # re-probe the connection on the next call
             return False
         
     
@@ -127,16 +146,32 @@ class AlpacaFocuserDriver:
                 logger.warning("Halting focuser...")
                 self.focuser.Halt()
                 # Wait for Focuser to stop moving
+                poll_interval = self.config.get('move_poll_interval', 0.2)
                 while self.focuser.IsMoving:
-                    time.sleep(0.5)
+                    time.sleep(poll_interval)
                 # Log the current (final) position of the Focuser
                 logger.info(f"Focuser halted at position {self.get_position()}")
                 return True
         except Exception as e:
             logger.error(f"Focuser halt failed: {e}")
+            self.connected = False      # re-probe the connection on the next call
             return False
 
     
+    def _read_many(self, names) -> Dict[str, Any]:
+        '''Read several Alpaca properties concurrently rather than one round-trip after another.
+        Returns {name: value}, with the exception as the value for any read that failed'''
+        if self._read_pool is None:
+            self._read_pool = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="focuser-read")
+        futures = {name: self._read_pool.submit(getattr, self.focuser, name) for name in names}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+        return results
+    
     def refresh_info(self, force: bool = True) -> Dict[str, Any]:
         """Refresh and cache the focuser state. Returns the info dict."""
         if not self.is_connected():
@@ -145,18 +180,23 @@ class AlpacaFocuserDriver:
 
         # If we know nothing about the Focuser and if we are forcing the info to update, update it
         if self.info is None or force:
-            # Get position, limits and current safety status
-            current_pos = self.get_position()
+            # Get position, limits and current safety status - the independent Alpaca reads go out together
+            reads = self._read_many(("Position", "Name", "Description", "IsMoving", "StepSize"))
+            for required in ("Position", "Name", "IsMoving"):
+                if isinstance(reads[required], Exception):
+                    self.connected = False      # re-probe the connection on the next call
+                    raise AlpacaFocuserError(f"Failed to read {required}: {reads[required]}")
+            current_pos = reads["Position"]
             limits = self.get_limits()
             is_safe, safety_status = self.check_position_safety(current_pos)
             # Populate and return the info dictionary
             self.info = {
                 "connected": True,
-                "name": self.focuser.Name,
-                "description": getattr(self.focuser, "Description", "Unknown"),
+                "name": reads["Name"],
+                "description": "Unknown" if isinstance(reads["Description"], Exception) else reads["Description"],
                 "position": current_pos,
-                "is_moving": self.focuser.IsMoving,
-                "step_size": getattr(self.focuser, "StepSize", None),
+                "is_moving": reads["IsMoving"],
+                "step_size": None if isinstance(reads["StepSize"], Exception) else reads["StepSize"],
                 "limits": limits,
                 "position_safe": is_safe,
                 "safety_status": safety_status,
@@ -168,19 +208,28 @@ class AlpacaFocuserDriver:
     def get_focuser_info(self, refresh: bool = False) -> Dict[str, Any]:
         """Get info about the Focuser (can just return cached info unless refresh=True)."""
         if refresh or self.info is None:
-            return self.refresh_info(force=True)
+            # Concurrent callers (GUI + scripts) share one in-flight refresh
+            return self._info_coalescer.run(lambda: self.refresh_info(force=True))
         return self.info
     
     def get_limits(self) -> Dict[str, Union[int, str]]:
-        '''Get the mechanical limts of the Focuser. Min is 0, Max from Alpaca function call'''
+        '''Get the mechanical limts of the Focuser. Min is 0, Max from Alpaca function call (read once, then cached)'''
+        if self.limits is not None:
+            return self.limits
         if not self.is_connected():
             return {"error": "not connected"}
         try:
-            # Get max position from Alpaca Function call
+            # Get max position from Alpaca Function call - MaxStep is fixed by the hardware so cache it
             max_step = self.focuser.MaxStep
-            return {"min": 0, "max": max_step}
+            self.limits = {"min": 0, "max": int(max_step)}
+            return self.limits
         except Exception as e:
+            self.connected = False      # re-probe the connection on the next call
             return {"error": f"Failed to get focuser limits: {e}"}
+    
+    def invalidate_limits(self):
+        '''Forget the cached limits so the next get_limits() re-reads MaxStep (e.g. after reconfiguring the focuser)'''
+        self.limits = None
         
     
     def check_position_safety(self, target_position) -> Tuple[bool, str]:
@@ -218,6 +267,10 @@ class AlpacaFocuserDriver:
         self.info = None
         self.position = None
         self.limits = None
+        # Release the refresh_info worker threads - a later refresh creates a fresh pool
+        if self._read_pool is not None:
+            self._read_pool.shutdown(wait=False)
+            self._read_pool = None
     
     def set_position_from_filter(self, filter_code):
         '''Change the Focuser position based on a given filter (usually initiated from the combined focuser/filterwheel driver in focus_filter_manager.py)'''       
@@ -1,11 +1,13 @@
+import math
 import threading
-from astropy.coordinates import SkyCoord, AltAz, EarthLocation
-from astropy.time import Time
-import astropy.units as u
 import time
 import logging
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, Tuple
-from astroplan import Observer
+
+import requests
+
+from ..alpaca_session import enable_keepalive
 
 
 try:
@@ -17,9 +19,28 @@ except ImportError:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Sidereal time advances this many radians per SI second; LST is extrapolated from an astropy anchor at this rate
+SIDEREAL_RATE_RAD_S = 2.0 * math.pi * 1.00273781191135448 / 86400.0
+LST_ANCHOR_MAX_AGE = 600.0  # seconds before the anchor is re-taken from astropy
+
+# Network hiccups worth retrying mid-move (a dropped packet shouldn't abort a flip) - and the backoff between attempts
+TRANSIENT_HTTP_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+TRANSIENT_RETRY_DELAYS = (0.1, 0.2, 0.4)
+
+# Minimum time after MoveAbsolute before a stopped, unchanged rotator counts as stalled (IsMoving can lag the command)
+STALL_GRACE_SEC = 0.5
+
 class AlpacaRotatorError(Exception):
     pass
 
+@dataclass
+class RotatorStatus:
+    '''One status read of the rotator (see AlpacaRotatorDriver.get_status)'''
+    connected: bool
+    is_moving: Optional[bool]       # None if not requested
+    position: Optional[float]       # None if the rotator couldn't be read
+    t_ns: int                       # time.monotonic_ns() of the read
+
 # Set up rotator driver class
 class AlpacaRotatorDriver:
     
@@ -27,14 +48,22 @@ class AlpacaRotatorDriver:
         # ensure Alpyca library installed
         if not ALPACA_AVAILABLE:
             raise AlpacaRotatorError("Alpaca library not available - please install")
+        enable_keepalive()      # all Alpaca property calls share one keep-alive HTTP session
         
         self.rotator = None
         self.config = None
         self.connected = False
-        self.last_rotation_move_ts = 0.0
+        self.last_rotation_move_ts = 0.0   # time.monotonic() of the last platesolve rotation correction
         self.rotator_sign = 1          # overridden from field_rotation.yaml during init
         self._platesolve_sign = 1      # overridden from field_rotation.yaml during init
         self._platesolve_clamp_deg = 5.0  # hard default - leave as-is unless added to YAML later
+        self._conn_cache_until = 0.0   # time.monotonic() until which a confirmed connection is trusted without a probe
+        self._conn_cache_ttl = 1.0     # overridden from devices.yaml (connection_check_ttl) on connect
+        self._slew_rate = 4.0          # deg/s, overridden from devices.yaml (slew_rate_deg_s) on connect
+        self._static_info_cache = None # name/description/can_reverse - fixed for a connection, read once by get_rotator_info
+        self.field_tracker = None      # FieldRotationTracker, set by initialize_field_rotation
+        self._last_pos = None          # last Position read (by any probe/status read) and its time.monotonic()
+        self._last_pos_ts = 0.0
 
         
     def connect(self, config: Dict[str, Any]) -> bool:
@@ -46,6 +75,18 @@ class AlpacaRotatorDriver:
             mechanical_limits = config.get('mechanical_limits', {})
             self.min_limit = mechanical_limits.get('min_deg', 94.0)   
             self.max_limit = mechanical_limits.get('max_deg', 320.0)
+            # Safety thresholds for check_position_safety - fixed once connected, so resolved here rather than per check
+            limits_config = config.get('limits', {})
+            self._warn_margin = limits_config.get('warning_margin_deg', 30.0)      # when to 'warn' mechanical limit is approaching (but still process req)
+            self._emerg_margin = limits_config.get('emergency_margin_deg', 10.0)   # when to reject requests
+            self._min_plus_emerg = self.min_limit + self._emerg_margin
+            self._max_minus_emerg = self.max_limit - self._emerg_margin
+            self._min_plus_warn = self.min_limit + self._warn_margin
+            self._max_minus_warn = self.max_limit - self._warn_margin
+            self._conn_cache_ttl = float(config.get('connection_check_ttl', 1.0))
+            self._conn_cache_until = 0.0
+            self._slew_rate = float(config.get('slew_rate_deg_s', 4.0))
+            self._last_pos = None
             
             logger.debug(f"Connecting to Alpaca Rotator at {address}, device {device_number}")
             
@@ -61,7 +102,7 @@ class AlpacaRotatorDriver:
                 logger.debug(f"Successfully connected to rotator: {rotator_name}")
                 self.connected = True
                 
-                current_pos = self.get_position()
+                current_pos = self.get_position(max_age=self._conn_cache_ttl)
                 logger.debug(f"Current rotator position: {current_pos:.6f}°")
                 logger.debug(f"Mechanical limits: {self.min_limit:.1f}° to {self.max_limit:.1f}°")
                 
@@ -72,6 +113,7 @@ class AlpacaRotatorDriver:
         except Exception as e:
             logger.error(f"Rotator connection error: {e}")
             self.connected = False
+            self._conn_cache_until = 0.0
             return False
         
     def disconnect(self):
@@ -81,6 +123,8 @@ class AlpacaRotatorDriver:
                 self.rotator.Connected = False
                 logger.info('Rotator disconnected')
             self.connected = False
+            self._conn_cache_until = 0.0
+            self._static_info_cache = None
             return True
         
         except Exception as e:
@@ -88,53 +132,63 @@ class AlpacaRotatorDriver:
             return False
         
     def is_connected(self):
-        '''Get connected status (T/F) based on a Position call (since .Connected is unreliable)'''
+        '''Get connected status (T/F) based on a Position call (since .Connected is unreliable).
+        A successful check is trusted for connection_check_ttl seconds, so back-to-back calls don't each cost a round-trip'''
         try:
             if not self.rotator:
                 return False
+            if self.connected and time.monotonic() < self._conn_cache_until:
+                return True
             
             # Since .Connected is unreliable, testing a position call to see if connected
             # logic: if we can get a position, we're functionally connected to the rotator
-            _ = self.rotator.Position
+            self._last_pos = self.rotator.Position
+            self._last_pos_ts = now = time.monotonic()
             self.connected = True
+            self._conn_cache_until = now + self._conn_cache_ttl
             return True
 
         except Exception as e:
             logger.error(f"Rotator connection test failed: {e}")
             self.connected = False
+            self._conn_cache_until = 0.0
             return False
         
-    def get_position(self):
-        '''Get the current position of the rotator'''
+    def get_position(self, max_age: Optional[float] = None):
+        '''Get the current position of the rotator.
+        max_age: accept a position read within the last max_age seconds (e.g. by the is_connected() probe) instead
+        of a fresh read - for info/status callers that can tolerate it, never for move control'''
         if not self.is_connected():
             raise AlpacaRotatorError("Cannot get position - rotator not connected")
+        if max_age is not None and self._last_pos is not None and time.monotonic() - self._last_pos_ts < max_age:
+            return self._last_pos
         
         try:
             # Alpaca function call
-            position = self.rotator.Position
+            position = self._last_pos = self.rotator.Position
+            # A good read is as good as a connection probe
+            self._last_pos_ts = now = time.monotonic()
+            self._conn_cache_until = now + self._conn_cache_ttl
             return position
         except Exception as e:
+            self._conn_cache_until = 0.0
             raise AlpacaRotatorError(f"Failed to get position: {e}")
         
         
     def check_position_safety(self, target_position: float) -> Tuple[bool, str]:
         '''Check the safety of a target rotator position (within mechanical limits)'''
-        # Get mechanical limits from devices.yaml
-        limits_config = self.config.get('limits', {})
-        warning_margin = limits_config.get('warning_margin_deg', 30.0)      # when to 'warn' mechanical limit is approaching (but still process req)
-        emergency_margin = limits_config.get('emergency_margin_deg', 10.0)  # when to reject requests
-        
+        # Limits and margins (from devices.yaml) are resolved in connect()
         
         # If target position is outside emergency limits - return False and reject requests to move to target position
-        if target_position <= (self.min_limit + emergency_margin):
-            return False, f"Position {target_position:.6f}° within emergency margin ({emergency_margin}°) of min limit {self.min_limit}°"
-        if target_position >= (self.max_limit - emergency_margin):
-            return False, f"Position {target_position:.6f}° within emergency margin ({emergency_margin}°) of max limit {self.max_limit}°"
+        if target_position <= self._min_plus_emerg:
+            return False, f"Position {target_position:.6f}° within emergency margin ({self._emerg_margin}°) of min limit {self.min_limit}°"
+        if target_position >= self._max_minus_emerg:
+            return False, f"Position {target_position:.6f}° within emergency margin ({self._emerg_margin}°) of max limit {self.max_limit}°"
         
         # Otherwise, if target position is within warning limits - log a warning but still return True and process move requests
-        if target_position <= (self.min_limit + warning_margin):
+        if target_position <= self._min_plus_warn:
             return True, f"Warning: {target_position:.6f}° approaching minimum limit {self.min_limit}°"
-        if target_position >= (self.max_limit - warning_margin):
+        if target_position >= self._max_minus_warn:
             return True, f"Warning: {target_position:.6f}° approaching maximum limit {self.max_limit}°"
         
         # Any other target position is fine
@@ -202,14 +256,21 @@ class AlpacaRotatorDriver:
                 logger.warning(safety_msg)
                 
             logger.info(f"Moving rotator to position: {position_deg:.6f}°")
+            # Starting point, for the travel-time estimate (the is_connected() probe above usually just read it)
+            start_pos = self.get_position(max_age=self._conn_cache_ttl)
             
             # If save, move the rotator via Alpaca function call
             self.rotator.MoveAbsolute(position_deg)
-            
-            # Log movements while the rotator is still moving
-            while self.rotator.IsMoving:
-                logger.debug(f"    Rotating...currently at {self.rotator.Position:.6f}°")
-                time.sleep(0.5)
+            self._last_pos = None      # the cached read is pre-move now
+            move_timeout = self.config.get('move_timeout', 120.0)
+            if not self._wait_until_stopped(position_deg, max_wait=move_timeout, start=start_pos):
+                logger.error(f"Rotator move did not complete within {move_timeout} s - halting")
+                # Best effort - a stuck rotator must be stopped, not just left unwatched
+                try:
+                    self.rotator.Halt()
+                except Exception as e:
+                    logger.error(f"Halt failed: {e}")
+                return False
                 
             # If a settle time is set in devices.yaml - wait for that time after a rotator move
             settle_time = self.config.get('settle_time', 2.0)
@@ -222,8 +283,43 @@ class AlpacaRotatorDriver:
             return True
         except Exception as e:
             logger.error(f"Rotation failed: {e}")
+            self._conn_cache_until = 0.0
             return False
         
+    def _wait_until_stopped(self, target: Optional[float] = None, max_wait: Optional[float] = None,
+                            start_interval: float = 0.05, start: Optional[float] = None) -> bool:
+        '''Wait for a move to finish - poll quickly at first so short moves are seen to finish promptly, then back off
+        (x1.5 up to 1 s) so long moves don't flood the driver. Returns early once within 0.01° of target (if given),
+        or False if the rotator is still moving after max_wait seconds.
+        IsMoving is polled every time, Position only every 3rd poll (or every poll when debug logging is on).
+        With target and start given, the travel time at slew_rate_deg_s (less 0.5 s) is slept through before polling'''
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        if target is not None and start is not None:
+            travel_time = abs(target - start) / self._slew_rate - 0.5
+            if max_wait is not None:
+                travel_time = min(travel_time, max_wait)
+            if travel_time > 0:
+                time.sleep(travel_time)
+        interval = start_interval
+        debug = logger.isEnabledFor(logging.DEBUG)
+        polls = 0
+        while self.rotator.IsMoving:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning(f"Rotator still moving after {max_wait} s (at {self.rotator.Position:.6f}°)")
+                return False
+            # Some drivers hold IsMoving through their own settle - stop waiting once at the target
+            if debug or (target is not None and polls % 3 == 0):
+                current_pos = self.rotator.Position
+                if target is not None and abs(current_pos - target) < 0.01:
+                    break
+                # Log movements while the rotator is still moving
+                logger.debug("    Rotating...currently at %.6f°", current_pos)
+            polls += 1
+            time.sleep(interval)
+            interval = min(interval * 1.5, 1.0)
+        self._conn_cache_until = time.monotonic() + self._conn_cache_ttl
+        return True
+        
     def apply_rotation_correction(self, rotation_offset_deg: float) -> bool:
         """
         Actively de-rotate the camera by the platesolver's reported sky-PA delta (deg).
@@ -239,11 +335,10 @@ class AlpacaRotatorDriver:
 
             # Map sky PA delta to mechanical delta:
             # mech = sign * (sky_pa + mechanical_zero) => Δmech = sign * Δsky
-            rotator_sign = getattr(self, "rotator_sign", +1)
-            mech_delta = rotator_sign * float(rotation_offset_deg)
+            mech_delta = self.rotator_sign * float(rotation_offset_deg)
 
             # Optional clamp to ignore wild solves
-            clamp_deg = float(getattr(self, "_platesolve_clamp_deg", 5.0))
+            clamp_deg = float(self._platesolve_clamp_deg)
             if abs(mech_delta) > clamp_deg:
                 logger.warning(f"Rotation correction clamped from {mech_delta:+.2f}° to "
                             f"{clamp_deg if mech_delta > 0 else -clamp_deg:+.2f}°")
@@ -261,17 +356,17 @@ class AlpacaRotatorDriver:
                         f"mech Δ={mech_delta:+.6f}° (from {current_pos:.6f}° → {target_pos:.6f}°)")
             
             # Rotator position move
-            if hasattr(self, 'field_tracker') and self.field_tracker:
-                success = self.field_tracker._execute_tracking_move(target_pos)
+            if self.field_tracker is not None:
+                success = self.field_tracker._execute_tracking_move(target_pos, current_pos)
             else:
                 self.rotator.MoveAbsolute(target_pos)
-                time.sleep(1)
-                success = True
+                self._last_pos = None
+                success = self._wait_until_stopped(target_pos, max_wait=5.0, start=current_pos)
             if not success:
                     logger.warning("Platesolve rotation correction failed")
                     return False
 
-            self.last_rotation_move_ts = time.time()
+            self.last_rotation_move_ts = time.monotonic()
 
             # minimal settle (configurable)
             settle_time = float(self.config.get('settle_time', 0.0))
@@ -279,20 +374,10 @@ class AlpacaRotatorDriver:
                 time.sleep(settle_time)
 
             # --- RESYNC TRACKER STATE AFTER A DISCRETE THETA MOVE ---
-            try:
-                if hasattr(self, "field_tracker") and self.field_tracker:
-                    # 1) short cooldown so the next tick doesn't immediately re-command
-                    #    (use max with settle_time if you have a non-zero settle)
-                    cooldown = max(0.3, float(self.config.get('settle_time', 0.0)))
-                    self.field_tracker._cooldown_until = time.time() + cooldown
-
-                    # 2) refresh tracker’s last commanded PA to the *current* setpoint
-                    #    so future platesolve feedback compares to this baseline
-                    pa_now = self.field_tracker.calculate_required_pa(Time.now())
-                    if pa_now is not None:
-                        self.field_tracker._last_pa_cmd = float(pa_now)
-            except Exception:
-                pass
+            if self.field_tracker is not None:
+                # short cooldown so the next tick doesn't immediately re-command
+                # (use max with settle_time if you have a non-zero settle)
+                self.field_tracker._cooldown_until = time.monotonic() + max(0.3, settle_time)
             
             # Get and log current (final) position of the rotator
             final_pos = self.get_position()
@@ -301,8 +386,32 @@ class AlpacaRotatorDriver:
 
         except Exception as e:
             logger.error(f"Rotation correction failed: {e}")
+            self._conn_cache_until = 0.0
             return False
         
+    def get_status(self, moving: bool = True) -> RotatorStatus:
+        '''Read position (and moving status, unless moving=False) in one go. Doubles as the connection check -
+        a failed read returns connected=False, position=None'''
+        if not self.rotator:
+            return RotatorStatus(False, None, None, time.monotonic_ns())
+        try:
+            return self.read_status(moving)
+        except Exception as e:
+            logger.error(f"Rotator status read failed: {e}")
+            self.connected = False
+            self._conn_cache_until = 0.0
+            return RotatorStatus(False, None, None, time.monotonic_ns())
+
+    def read_status(self, moving: bool = True) -> RotatorStatus:
+        '''get_status() without the error handling - a failed read raises the underlying exception'''
+        # Alpaca function calls
+        position = self._last_pos = self.rotator.Position
+        is_moving = self.rotator.IsMoving if moving else None
+        self.connected = True
+        self._last_pos_ts = now = time.monotonic()
+        self._conn_cache_until = now + self._conn_cache_ttl
+        return RotatorStatus(True, is_moving, position, time.monotonic_ns())
+        
     def is_moving(self) -> bool:
         '''Get moving status of the rotator via Alpaca function call'''
         if not self.is_connected():
@@ -312,6 +421,7 @@ class AlpacaRotatorDriver:
             return self.rotator.IsMoving
         except Exception as e:
             logger.error(f"Cannot check moving status: {e}")
+            self._conn_cache_until = 0.0
             return False
         
     def halt(self) -> bool:
@@ -322,10 +432,12 @@ class AlpacaRotatorDriver:
         try:
             logger.warning("Halting rotator...")
             self.rotator.Halt()
+            self._last_pos = None
             time.sleep(0.5)
             return True
         except Exception as e:
             logger.error(f"Halt failed: {e}")
+            self._conn_cache_until = 0.0
             return False
         
     def get_rotator_info(self) -> Dict[str, Any]:
@@ -334,18 +446,27 @@ class AlpacaRotatorDriver:
             return {'connected': False}
         
         try:
-            # Get current position and safety status of that position
-            current_pos = self.get_position()
+            # Name/description/capabilities don't change while connected - only read them once
+            if self._static_info_cache is None:
+                self._static_info_cache = {
+                    "name": self.rotator.Name,
+                    "description": getattr(self.rotator, 'Description', 'Unknown'),
+                    'can_reverse': getattr(self.rotator, 'CanReverse', False),
+                }
+            static_info = self._static_info_cache
+
+            # Get current position (the is_connected() probe's read will do) and safety status of that position
+            current_pos = self.get_position(max_age=self._conn_cache_ttl)
             is_safe, safety_status = self.check_position_safety(current_pos)
             
             # Get and return information dictionary
             info={
                 'connected': True,
-                "name": self.rotator.Name,
-                "description": getattr(self.rotator, 'Description', 'Unknown'),
+                "name": static_info['name'],
+                "description": static_info['description'],
                 "position_deg": current_pos,
                 "is_moving": self.rotator.IsMoving,
-                'can_reverse': getattr(self.rotator, 'CanReverse', False),
+                'can_reverse': static_info['can_reverse'],
                 # "step_size": getattr(self.rotator, 'StepSize', None),                 # Do not use - not implemented on driver
                 # "target_position": getattr(self.rotator, 'TargetPosition', None),     # Do not use - not implemented on driver
                 "mechanical_limits": {'min': self.min_limit, 'max': self.max_limit},
@@ -355,6 +476,7 @@ class AlpacaRotatorDriver:
             return info
         except Exception as e:
             logger.error(f"Failed to get rotator info: {e}")
+            self._conn_cache_until = 0.0
             return {'connected': True, "error": str(e)}
         
     def initialize_field_rotation(self, observatory_config, field_rotation_config):
@@ -376,32 +498,32 @@ class AlpacaRotatorDriver:
 
     def set_tracking_target(self, ra_hours, dec_deg, reference_pa_deg=None):
         """Set target for field rotation tracking"""
-        if hasattr(self, 'field_tracker'):
+        if self.field_tracker is not None:
             self.field_tracker.set_target(ra_hours, dec_deg, reference_pa_deg)
 
     def start_field_tracking(self):
         """Start continuous field rotation"""
-        if hasattr(self, 'field_tracker'):
+        if self.field_tracker is not None:
             self.field_tracker.start_tracking()
             return True
         return False
 
     def stop_field_tracking(self):
         """Stop continuous field rotation"""
-        if hasattr(self, 'field_tracker'):
+        if self.field_tracker is not None:
             self.field_tracker.stop_tracking()
             return True
         return False
 
     def apply_platesolve_feedback(self, theta_offset_deg):
         """Apply platesolve rotation feedback to calibration"""
-        if not hasattr(self, 'field_tracker'):
+        if self.field_tracker is None:
             return False
             
         try:
-            platesolve_sign = getattr(self, '_platesolve_sign', 1)
-            correction = platesolve_sign * theta_offset_deg
+            correction = self._platesolve_sign * theta_offset_deg
             self.field_tracker.mechanical_zero += correction
+            self.field_tracker._recompute_pa_constants()
             logger.info(f"Updated mechanical zero: {correction:+.3f}° -> {self.field_tracker.mechanical_zero:.3f}°")
             return True
         except Exception as e:
@@ -410,7 +532,7 @@ class AlpacaRotatorDriver:
 
     def check_wrap_status(self):
         """Check if wrap management is needed for rotator flips"""
-        if hasattr(self, 'field_tracker'):
+        if self.field_tracker is not None:
             return self.field_tracker.check_wrap_needed()
         return False
 
@@ -421,7 +543,15 @@ class FieldRotationTracker:
         self.rotator = rotator_driver
         self.obs_config = observatory_config
         self.fr_config = field_rotation_config
-        self._cooldown_until = 0.0
+        self._cooldown_until = 0.0     # time.monotonic() until which tracking/flip checks are paused
+
+        # numpy/astropy are only needed for field rotation - imported here so plain rotator use
+        # (connect/move/halt, emergency shutdown) doesn't pay their import time
+        import numpy as np
+        from astropy.coordinates import SkyCoord, EarthLocation
+        from astropy.time import Time
+        import astropy.units as u
+        self._np, self._SkyCoord, self._Time, self._u = np, SkyCoord, Time, u
 
         # Observatory location
         self.location = EarthLocation(
@@ -430,12 +560,32 @@ class FieldRotationTracker:
             height=observatory_config.get('altitude', 0) * u.m
         )
 
-        # create astroplan Observer for parallactic angle calculations
-        self.observer = Observer(location=self.location)
+        # Site latitude terms for the parallactic angle formula (see _refresh_pa_table)
+        self._tan_lat = math.tan(math.radians(observatory_config['latitude']))
+        self._lst_anchor = None  # (unix time, apparent LST in rad) from astropy - see _local_sidereal_time
         
         # Tracking state
         self.target_coord = None  # J2000 SkyCoord
         self.reference_pa = None  # Fixed detector PA
+        self._ra_rad = self._sin_dec = self._cos_dec = None  # target terms for the parallactic angle formula
+
+        # Parallactic angle table - evaluated for the next pa_table_span_sec in one vectorised numpy pass and interpolated per tick
+        self._pa_table = None  # (start unix time, end unix time, parallactic angles in deg) for the current target
+
+        # Settings from field_rotation.yaml - resolved once here rather than looked up on every tick/move
+        tracking_config = field_rotation_config['tracking']
+        wrap_config = field_rotation_config['wrap_management']
+        self._update_rate = float(tracking_config['update_rate_hz'])
+        self._move_threshold = float(tracking_config['move_threshold_deg'])
+        self._settle_time = float(tracking_config['settle_time_sec'])
+        self._pa_table_span = float(tracking_config.get('pa_table_span_sec', 60.0))
+        self._pa_table_step = float(tracking_config.get('pa_table_step_sec', 2.0))
+        self._slew_rate = rotator_driver._slew_rate  # rotator max speed (devices.yaml slew_rate_deg_s), for move time estimates
+        self._wrap_enabled = bool(wrap_config['enabled'])
+        self._flip_margin = float(wrap_config['flip_margin_deg'])
+        self._flip_timeout = float(wrap_config.get('flip_timeout_duration', 45.0))  # timeout for 180° move
+        self._lookahead = float(wrap_config.get('lookahead_minutes', 5.0)) * 60.0  # seconds_until_flip horizon
+
         self.is_tracking = False
         self.tracking_thread = None
         self.stop_event = threading.Event()
@@ -443,70 +593,160 @@ class FieldRotationTracker:
         # Calibration parameters
         self.rotator_sign = field_rotation_config['calibration']['rotator_sign']
         self.mechanical_zero = field_rotation_config['calibration']['mechanical_zero_deg']
+        self._recompute_pa_constants()
 
         logger.debug("FieldRotationTracker initialized")
 
+    def _recompute_pa_constants(self):
+        """Fold rotator_sign and mechanical_zero into gain/bias for pa_to_rotator_position - call after changing either"""
+        self._pa_gain = self.rotator_sign
+        self._pa_bias = self.rotator_sign * self.mechanical_zero
+
     def set_target(self, ra_hours, dec_deg, reference_pa_deg=None):
         """Set target coordinates and (if not supplied) freeze the current view as reference PA."""
-        self.target_coord = SkyCoord(
+        u = self._u
+        self.target_coord = self._SkyCoord(
             ra=ra_hours * u.hour,
             dec=dec_deg * u.deg,
             frame='icrs'  # J2000
         )
+        self._ra_rad = math.radians(ra_hours * 15.0)
+        self._sin_dec = math.sin(math.radians(dec_deg))
+        self._cos_dec = math.cos(math.radians(dec_deg))
+        self._pa_table = None
 
         if reference_pa_deg is not None:
             # user/config explicitly sets the desired detector PA wrt sky
             self.reference_pa = float(reference_pa_deg)
         else:
             # Freeze to the *current* view so the first command is a no-op.
-            t0 = Time.now()
-            q0 = self.observer.parallactic_angle(t0, self.target_coord).to(u.deg).value  # east-of-north
-            mech0 = self.rotator.get_position()
+            try:
+                q0 = self.parallactic_angle_at(time.time())  # east-of-north
+                mech0 = self.rotator.get_position()
+            except Exception:
+                # Never leave a target without a reference PA - calculate_required_pa relies on it being set
+                self.target_coord = None
+                raise
             # mech = sign * (sky_pa + mechanical_zero)  =>  sky_pa = (mech / sign) - mechanical_zero
             sky_pa0 = (mech0 / self.rotator_sign) - self.mechanical_zero
             self.reference_pa = sky_pa0 + q0
             logger.info(f"[field-rot] reference_pa frozen at start: {self.reference_pa:.3f}°")
+            if self._wrap_enabled:
+                t_flip = self.seconds_until_flip(mech0)
+                if t_flip is not None:
+                    logger.info(f"[field-rot] Rotator will need a 180° flip in ~{t_flip / 60.0:.1f} min")
 
         logger.debug(f"Tracking target set: RA={ra_hours:.4f} h Dec={dec_deg:.4f}°")
 
-    def calculate_required_pa(self, obs_time=None):
-        """Calculate sky PA that keeps detector fixed to the frozen reference."""
+    def calculate_required_pa(self, obs_time=None, t_unix=None):
+        """Calculate sky PA that keeps detector fixed to the frozen reference.
+        Time is obs_time (astropy Time) or t_unix (unix seconds, no Time object needed), defaulting to now."""
         if not self.target_coord:
             return None
 
-        if obs_time is None:
-            obs_time = Time.now()
+        if t_unix is None:
+            t_unix = time.time() if obs_time is None else obs_time.unix
+        q = self.parallactic_angle_at(t_unix)
+
+        # Hold frozen ref forever (set_target always sets it): desired sky PA = ref - q(now)
+        return self.reference_pa - q
 
-        q = self.observer.parallactic_angle(obs_time, self.target_coord).to(u.deg).value
+    def parallactic_angle_at(self, t_unix):
+        """Parallactic angle (deg) of the target at unix time t_unix, interpolated from the PA table"""
+        table = self._pa_table
+        if table is None or not (table[0] <= t_unix <= table[1]):
+            table = self._refresh_pa_table(t_unix)
+        t_start, _, q = table
+        # Samples are evenly spaced, so the bracketing pair is found by index arithmetic rather than a search
+        pos = (t_unix - t_start) / self._pa_table_step
+        i = min(int(pos), len(q) - 2)
+        return q[i] + (pos - i) * (q[i + 1] - q[i])
 
-        if self.reference_pa is None:
-            # One-time bootstrap in case set_target() was not called with freeze logic
-            mech = self.rotator.get_position()
-            q0 = self.observer.parallactic_angle(Time.now(), self.target_coord).to(u.deg).value
-            sky_pa0 = (mech / self.rotator_sign) - self.mechanical_zero
-            self.reference_pa = sky_pa0 + q0
-            logger.info(f"[field-rot] reference_pa auto-bootstrapped: {self.reference_pa:.3f}°")
+    def _refresh_pa_table(self, t_unix):
+        """Evaluate the parallactic angle over the next pa_table_span_sec in a single vectorised call"""
+        np = self._np
+        n_samples = int(np.ceil(self._pa_table_span / self._pa_table_step)) + 1
+        times = t_unix + np.arange(n_samples) * self._pa_table_step
+        # Same formula as astroplan's Observer.parallactic_angle, with the site/target trig precomputed:
+        # q = atan2(sin H, tan(lat) cos(dec) - sin(dec) cos H), H = LST - RA
+        hour_angle = self._local_sidereal_time(times) - self._ra_rad
+        q = np.degrees(np.arctan2(np.sin(hour_angle), self._tan_lat * self._cos_dec - self._sin_dec * np.cos(hour_angle)))
+        # Unwrap so interpolating across the ±180° seam doesn't sweep through 0°; a plain list indexes faster per tick
+        table = (float(times[0]), float(times[-1]), np.rad2deg(np.unwrap(np.deg2rad(q))).tolist())
+        self._pa_table = table
+        return table
 
-        # Hold frozen ref forever: desired sky PA = ref - q(now)
+    def calculate_required_pa_batch(self, seconds_from_now, t_unix=None):
+        """Vectorised calculate_required_pa - numpy array of sky PA at each offset (s) from t_unix (default now).
+        Evaluated directly (not from the PA table) so offsets can reach beyond pa_table_span_sec"""
+        if not self.target_coord:
+            return None
+        np = self._np
+        if t_unix is None:
+            t_unix = time.time()
+        times = t_unix + np.atleast_1d(np.asarray(seconds_from_now, dtype=float))
+        hour_angle = self._local_sidereal_time(times) - self._ra_rad
+        q = np.degrees(np.arctan2(np.sin(hour_angle), self._tan_lat * self._cos_dec - self._sin_dec * np.cos(hour_angle)))
         return self.reference_pa - q
 
+    def seconds_until_flip(self, current_pos=None, horizon_sec=None, step_sec=30.0):
+        """Seconds until tracking carries the rotator within flip_margin_deg of a mechanical limit, scanning
+        horizon_sec ahead (default wrap_management lookahead_minutes) in step_sec steps - None if not within it"""
+        if not self.target_coord:
+            return None
+        np = self._np
+        if current_pos is None:
+            current_pos = self.rotator.get_position()
+        horizon = self._lookahead if horizon_sec is None else horizon_sec
+        offsets = np.arange(0.0, horizon + step_sec, step_sec)
+        # Unwrap so a ±180° seam in PA isn't mistaken for a jump of the rotator
+        pa = np.rad2deg(np.unwrap(np.deg2rad(self.calculate_required_pa_batch(offsets))))
+        positions = current_pos + self._pa_gain * (pa - pa[0])
+        margin = self._flip_margin
+        near_limit = (positions - self.rotator.min_limit < margin) | (self.rotator.max_limit - positions < margin)
+        hits = np.flatnonzero(near_limit)
+        return float(offsets[hits[0]]) if hits.size else None
+
+    def _local_sidereal_time(self, times):
+        """Apparent LST (rad, not wrapped) at unix times - extrapolated at the sidereal rate from an astropy value
+        re-taken every LST_ANCHOR_MAX_AGE s, so most table refreshes need no astropy Time at all"""
+        t0 = float(times[0])
+        anchor = self._lst_anchor
+        if anchor is None or abs(t0 - anchor[0]) > LST_ANCHOR_MAX_AGE:
+            lst0 = self._Time(t0, format='unix', location=self.location).sidereal_time('apparent').radian
+            anchor = self._lst_anchor = (t0, float(lst0))
+        return anchor[1] + (times - anchor[0]) * SIDEREAL_RATE_RAD_S
+
+    def required_rotator_position(self, t_unix=None):
+        """Mechanical position that holds the frozen reference PA at t_unix (default now) -
+        calculate_required_pa + pa_to_rotator_position fused into one call for the tracking loop"""
+        if not self.target_coord:
+            return None
+        if t_unix is None:
+            t_unix = time.time()
+        return self._pa_gain * (self.reference_pa - self.parallactic_angle_at(t_unix)) + self._pa_bias
+
     def pa_to_rotator_position(self, sky_pa_deg):
         """Convert sky PA to rotator mechanical position"""
-        return self.rotator_sign * (sky_pa_deg + self.mechanical_zero)
+        # == rotator_sign * (sky_pa_deg + mechanical_zero)
+        return self._pa_gain * sky_pa_deg + self._pa_bias
 
-    def check_wrap_needed(self):
-        """Check if immediate 180° flip is needed"""
-        if not self.fr_config['wrap_management']['enabled']:
+    def check_wrap_needed(self, current_pos=None, now=None):
+        """Check if immediate 180° flip is needed (current_pos / now: position and time.monotonic() already read
+        this tick, if any)"""
+        if not self._wrap_enabled:
             logger.debug("Wrap management not enabled in field rotation config file - ignoring flip checks")
             return False
             
         # Don't trigger flip if we're in cooldown (already flipping or just finished)
-        import time as _t
-        if _t.time() < getattr(self, "_cooldown_until", 0.0):
+        if now is None:
+            now = time.monotonic()
+        if now < self._cooldown_until:
             return False
 
-        current_pos = self.rotator.get_position()
-        margin = self.fr_config['wrap_management']['flip_margin_deg']
+        if current_pos is None:
+            current_pos = self.rotator.get_position()
+        margin = self._flip_margin
         
         # Calculate distances from limits
         dist_from_min = current_pos - self.rotator.min_limit
@@ -516,12 +756,11 @@ class FieldRotationTracker:
         near_min_limit = dist_from_min < margin
         near_max_limit = dist_from_max < margin
         
-        # DEBUG LOGGING - Log every check with current state
-        logger.debug(f"[wrap-check] pos={current_pos:.2f}°, "
-                    f"min_dist={dist_from_min:.2f}°, max_dist={dist_from_max:.2f}°, "
-                    f"margin={margin:.1f}°, "
-                    f"near_min={near_min_limit}, near_max={near_max_limit}, "
-                    f"flip_needed={near_min_limit or near_max_limit}")
+        # DEBUG LOGGING - Log every check with current state (lazy %-formatting: this runs every tick)
+        logger.debug("[wrap-check] pos=%.2f°, min_dist=%.2f°, max_dist=%.2f°, margin=%.1f°, "
+                     "near_min=%s, near_max=%s, flip_needed=%s",
+                     current_pos, dist_from_min, dist_from_max, margin,
+                     near_min_limit, near_max_limit, near_min_limit or near_max_limit)
         
         if near_min_limit or near_max_limit:
             logger.info(f"[wrap-check] Immediate flip needed: pos={current_pos:.1f}°, "
@@ -552,132 +791,151 @@ class FieldRotationTracker:
 
     def _tracking_loop(self):
         """Main tracking loop with immediate flip capability"""
-        # Get config vals from field_rotation.yaml
-        update_rate = self.fr_config['tracking']['update_rate_hz']
-        move_threshold = self.fr_config['tracking']['move_threshold_deg']
-        sleep_interval = 1.0 / update_rate
+        # Config vals from field_rotation.yaml (resolved in __init__)
+        move_threshold = self._move_threshold
+        sleep_interval = 1.0 / self._update_rate
+        # Minimal cooldown after a tracking move to prevent immediate re-commanding - this also covers the
+        # post-move settle (field_rotation.yaml settle_time_sec), which the move no longer sleeps through
+        move_cooldown = max(0.5, 0.1 + self._settle_time)
+
+        # Bind everything the loop calls each tick to locals once, rather than resolving the attributes every tick
+        monotonic = time.monotonic
+        fabs = math.fabs
+        remainder = math.remainder
+        stop_is_set = self.stop_event.is_set
+        stop_wait = self.stop_event.wait
+        get_status = self.rotator.get_status
+        check_position_safety = self.rotator.check_position_safety
+        check_wrap_needed = self.check_wrap_needed
+        required_rotator_position = self.required_rotator_position
+        execute_tracking_move = self._execute_tracking_move
 
-        import time as _t
+        # Ticks are scheduled against a monotonic deadline so the time spent working doesn't stretch the update
+        # interval, and waiting on stop_event lets stop_tracking() interrupt the wait straight away
+        next_tick = monotonic()
+        offline_backoff = 0.0  # seconds between status reads while the rotator isn't answering (0 = online)
+        while not stop_is_set():
+            delay = next_tick - monotonic()
+            if delay > 0 and stop_wait(delay):
+                break
+            next_tick += sleep_interval
+            now = monotonic()
+            if next_tick < now:
+                # Overran by more than a tick (e.g. a move or flip) - resync instead of firing a burst of catch-up ticks
+                next_tick = now
 
-        while not self.stop_event.is_set():
             try:
-                if not self.rotator.is_connected() or not self.target_coord:
-                    time.sleep(sleep_interval)
+                if not self.target_coord:
                     continue
+                # In cooldown (after flip or regular move) neither the flip check nor tracking will act, and the move
+                # has just confirmed where the rotator is - so don't spend a status read on this tick
+                if now < self._cooldown_until:
+                    continue
+                # One wall-clock read per tick, shared by everything that needs the time for PA
+                tick_unix = time.time()
+
+                # One read of position + moving status per tick (also serves as the connection check)
+                status = get_status()
+                if not status.connected:
+                    # Unreachable - retry after 1, 2, 4 ... 10 s rather than failing (and logging) every tick
+                    offline_backoff = min(max(2.0 * offline_backoff, 1.0), 10.0)
+                    next_tick = monotonic() + offline_backoff
+                    continue
+                if offline_backoff:
+                    logger.info("[field-rot] Rotator reachable again, resuming tracking")
+                    offline_backoff = 0.0
 
                 # Skip if rotator is currently moving
-                if self.rotator.is_moving():
-                    time.sleep(sleep_interval)
+                if status.is_moving:
                     continue
+                current_position = status.position
 
                 # Check for immediate flip need FIRST
-                if self.check_wrap_needed():
+                if check_wrap_needed(current_position, now):
                     logger.info("[field-rot] Executing immediate 180° flip")
-                    success = self._execute_180_flip()
+                    success = self._execute_180_flip(tick_unix)
                     if success:
                         logger.info("[field-rot] Flip completed, resuming normal tracking")
                     else:
                         logger.error("[field-rot] Flip failed, will retry next cycle")
                     continue  # Skip normal tracking this cycle
-                
-                # Skip if we're in cooldown period (after flip or regular move)
-                if _t.time() < getattr(self, "_cooldown_until", 0.0):
-                    time.sleep(sleep_interval)
-                    continue
 
                 # Normal tracking logic
-                required_pa = self.calculate_required_pa()
-                if required_pa is None:
-                    time.sleep(sleep_interval)
+                required_position = required_rotator_position(tick_unix)
+                if required_position is None:
                     continue
 
-                required_position = self.pa_to_rotator_position(required_pa)
-                current_position = self.rotator.get_position()
+                # Angle difference normalized to [-180, +180] to handle wraparound (one C call)
+                error = remainder(required_position - current_position, 360.0)
+                abs_error = fabs(error)
 
-                # Proper angle difference calculation with wraparound
-                raw_error = required_position - current_position
-                
-                # Normalize to [-180, +180] range
-                if raw_error > 180:
-                    error = raw_error - 360
-                elif raw_error < -180:
-                    error = raw_error + 360
-                else:
-                    error = raw_error
-
-                # Debug logging with stricter threshold to avoid spam
-                if abs(error) > move_threshold and abs(error) < 15.0:
-                    logger.debug(f"[field-rot] err={error:.6f}°, thresh={move_threshold}°, req_pos={required_position:.6f}°")
+                if abs_error >= 30.0:
+                    logger.error(f"[field-rot] Rejecting huge error: {error:.6f}° - possible calculation bug")
 
                 # Only move if error exceeds threshold and error is reasonable
-                if abs(error) > move_threshold and abs(error) < 20.0:
+                elif move_threshold < abs_error < 20.0:
+                    # Debug logging with stricter threshold to avoid spam
+                    if abs_error < 15.0:
+                        logger.debug("[field-rot] err=%.6f°, thresh=%s°, req_pos=%.6f°", error, move_threshold, required_position)
+
                     target_position = current_position + error
 
                     # Safety check
-                    is_safe, safety_msg = self.rotator.check_position_safety(target_position)
+                    is_safe, safety_msg = check_position_safety(target_position)
                     if is_safe:
-                        logger.debug(f"[field-rot] Moving rotator: {current_position:.6f}° → {target_position:.6f}° (Δ={error:+.6f}°)")
+                        logger.debug("[field-rot] Moving rotator: %.6f° → %.6f° (Δ=%+.6f°)", current_position, target_position, error)
                         
                         # Use the existing position-based move method
-                        success = self._execute_tracking_move(target_position)
+                        success = execute_tracking_move(target_position, current_position)
                         
                         if success:
-                            # Set minimal cooldown to prevent immediate re-commanding
-                            cooldown_time = 0.5  # Short cooldown for normal moves
-                            self._cooldown_until = _t.time() + cooldown_time
+                            self._cooldown_until = monotonic() + move_cooldown
                         else:
                             logger.warning("[field-rot] Tracking move failed, will retry next cycle")
                             
                     else:
                         logger.warning(f"[field-rot] Unsafe rotator move rejected: {safety_msg}")
 
-                elif abs(error) >= 30.0:
-                    logger.error(f"[field-rot] Rejecting huge error: {error:.6f}° - possible calculation bug")
-
             except Exception as e:
                 logger.warning(f"[field-rot] Tracking loop error: {e}")
 
-            time.sleep(sleep_interval)
-
-    def _execute_180_flip(self) -> bool:
-        """Execute an immediate 180° flip of the rotator with atomic PA update and position move"""
+    def _execute_180_flip(self, t_unix=None) -> bool:
+        """Execute an immediate 180° flip of the rotator with atomic PA update and position move
+        (t_unix: time the flip target is computed for - defaults to now)"""
         try:
-            import time as _t
-            
             # 1. Set extended cooldown to pause normal tracking during flip
             flip_duration_estimate = 60.0  # Conservative estimate for 180° move + settling, adjust if flips take longer (based on max rotator speed setting in ASA ACC)
-            self._cooldown_until = _t.time() + flip_duration_estimate
+            self._cooldown_until = time.monotonic() + flip_duration_estimate
             
             # 2. Get current state
             current_pos = self.rotator.get_position()
-            current_pa = self.calculate_required_pa()
             
-            if current_pa is None:
-                logger.error("[field-rot] Cannot calculate PA for flip")
+            if self.reference_pa is None:
+                logger.error("[field-rot] Cannot flip - no reference PA set")
                 return False
             
-            logger.info(f"[field-rot] Starting 180° flip from pos={current_pos:.3f}°, pa={current_pa:.3f}°")
+            logger.info(f"[field-rot] Starting 180° flip from pos={current_pos:.3f}°, ref_pa={self.reference_pa:.3f}°")
             
             # 3. Update reference PA (this changes all future calculations)
             old_reference_pa = self.reference_pa
             self.reference_pa = (self.reference_pa + 180.0) % 360.0
             
             # 4. Calculate new target position based on updated reference
-            new_target_pa = self.calculate_required_pa()
+            new_target_pa = self.calculate_required_pa(t_unix=t_unix)
             new_target_pos = self.pa_to_rotator_position(new_target_pa)
             
             logger.info(f"[field-rot] Flip: ref_pa {old_reference_pa:.3f}° → {self.reference_pa:.3f}°")
             logger.info(f"[field-rot] Moving to pos={new_target_pos:.3f}° (pa={new_target_pa:.3f}°)")
             
             # 5. Execute the physical move
-            success = self._execute_flip_move(new_target_pos)
+            success = self._execute_flip_move(new_target_pos, current_pos)
             
             if success:
                 final_pos = self.rotator.get_position()
                 logger.info(f"[field-rot] 180° flip complete: {current_pos:.3f}° → {final_pos:.3f}°")
                 
                 # Set shorter cooldown for normal tracking to resume
-                self._cooldown_until = _t.time() + 2.0  # Brief settle period
+                self._cooldown_until = time.monotonic() + 2.0  # Brief settle period
             else:
                 # Revert reference_pa on failure to prevent system getting stuck
                 self.reference_pa = old_reference_pa
@@ -689,130 +947,156 @@ class FieldRotationTracker:
             logger.error(f"[field-rot] Flip execution error: {e}")
             return False
 
-    def _execute_flip_move(self, target_position: float) -> bool:
-        """Execute 180° flip move with position-based completion checking"""
-        try:
-            current_pos_start = self.rotator.get_position()
-            move_distance = abs(target_position - current_pos_start)
-            
-            # Use extended timeout for large moves (180° flips)
-            if move_distance > 120.0:  # Definitely a flip move
-                timeout_duration = self.fr_config['wrap_management'].get('flip_timeout_duration', 45.0)  # timeout for 180° move, from field_rotation.yaml
-                position_tolerance = 1.0  # Looser tolerance for big moves
-            else:
-                # Fallback for smaller moves
-                timeout_duration = max(15.0, move_distance / 2.0 + 5.0)
-                position_tolerance = 0.2
-            
-            logger.debug(f"[field-rot] Flip move: {move_distance:.1f}° in max {timeout_duration:.0f}s")
-            
-            # Start the move via Alpaca function call
-            self.rotator.rotator.MoveAbsolute(target_position)
-            
-            # Wait for completion using position-based checking
-            timeout_start = time.time()
-            last_progress_log = timeout_start
-            
-            while time.time() - timeout_start < timeout_duration:
-                current_pos = self.rotator.get_position()
-                
-                # Check if we've reached target within tolerance
-                if abs(current_pos - target_position) <= position_tolerance:
-                    logger.debug(f"[field-rot] Flip move reached target: {current_pos:.3f}°")
-                    
-                    # Brief settling period for large moves
-                    time.sleep(1.0)
-                    
-                    final_pos = self.rotator.get_position()
-                    logger.debug(f"[field-rot] Flip move complete: {current_pos_start:.3f}° → {final_pos:.3f}°")
-                    return True
-                
-                # Progress logging every 10 seconds to avoid spam
-                current_time = time.time()
-                if current_time - last_progress_log > 10.0:
-                    remaining_distance = abs(target_position - current_pos)
-                    logger.debug(f"[field-rot] Flip progress: at {current_pos:.3f}°, {remaining_distance:.1f}° to go")
-                    last_progress_log = current_time
-                
-                time.sleep(0.5)  # Check every 500ms
-            
-            # Timeout occurred
-            final_pos = self.rotator.get_position()
-            distance_moved = abs(final_pos - current_pos_start)
-            remaining_distance = abs(target_position - final_pos)
-            
-            logger.error(f"[field-rot] Flip timeout after {timeout_duration:.0f}s: "
-                        f"moved {distance_moved:.1f}°, {remaining_distance:.1f}° remaining")
-            return False
-            
-        except Exception as e:
-            logger.error(f"[field-rot] Flip move execution failed: {e}")
-            return False
+    def _wait_for_position(self, target_position: float, start_position: float, position_tolerance: float,
+                           timeout_duration: float, poll_interval: float, stall_check: bool = False):
+        """Wait for the rotator to come within position_tolerance of target_position after a MoveAbsolute.
+        The rotator can't arrive before distance / slew_rate_deg_s, so most of that time is slept through in one go
+        (waking poll_interval early), then polls are spaced by next_poll_interval() - wide while the rotator is still
+        far off, tightening as it closes in.
+        Returns (outcome, last position read) where outcome is 'reached', 'stalled' (stall_check only), 'timeout'
+        or 'stopped' (stop_tracking() called while waiting on the tracking thread)"""
+        # Integer monotonic deadlines, computed once - immune to wall-clock steps
+        monotonic_ns = time.monotonic_ns
+        command_ns = monotonic_ns()     # MoveAbsolute was sent just before this call
+        deadline_ns = command_ns + int(timeout_duration * 1e9)
+        next_log_ns = command_ns + 10_000_000_000
+        # Drivers can take a moment to raise IsMoving after MoveAbsolute - don't call a stall before this
+        stall_after_ns = command_ns + int(max(poll_interval, STALL_GRACE_SEC) * 1e9)
 
-    def _execute_tracking_move(self, target_position: float) -> bool:
-        """Execute a tracking move with position-based completion (unchanged from original)"""
-        try:
-            current_pos_start = self.rotator.get_position()
-            move_distance = abs(target_position - current_pos_start)
-            
-            # Calculate reasonable timeout based on move distance
-            # Assume conservative 2.5°/s + overhead
-            min_timeout = 5.0
-            estimated_time = move_distance / 2.5  # Conservative 2.5°/s estimate
-            timeout_duration = max(min_timeout, estimated_time + 3.0)
-            
-            # logger.debug(f"[field-rot] Move distance: {move_distance:.3f}°, timeout: {timeout_duration:.1f} s")
-            
-            # Start the move via Alapca function call
-            self.rotator.rotator.MoveAbsolute(target_position)
+        current_pos = start_position
+        stopped_at = None   # position at the previous poll, if the rotator reported not moving there
+
+        # Already within tolerance of the target - nothing to wait for
+        if abs(target_position - start_position) <= position_tolerance:
+            return 'reached', current_pos
+
+        # Skip the polls that can't possibly see the move finish
+        travel_time = (abs(target_position - start_position) - position_tolerance) / self._slew_rate
+        if travel_time > poll_interval and self._pause(min(travel_time - poll_interval, timeout_duration)):
+            return 'stopped', current_pos
+
+        retry_transient = self._retry_transient
+        read_status = self.rotator.read_status
+        next_poll_interval = self.next_poll_interval
+        # Read first, sleep after - a short move that has already finished returns without waiting a poll interval.
+        # That first read (straight after the command) is only a baseline for the stall check, never a stall itself
+        while monotonic_ns() < deadline_ns:
+            status = retry_transient(read_status, stall_check)
+            current_pos = status.position
             
-            # Wait for position to stabilize near target
-            timeout_start = time.time()
-            position_tolerance = 0.1  # Must be larger than the rotator's positioning error
-            last_pos = current_pos_start
-            stall_count = 0
+            # Check if we've reached target within tolerance
+            if abs(current_pos - target_position) <= position_tolerance:
+                return 'reached', current_pos
             
-            while time.time() - timeout_start < timeout_duration:
-                current_pos = self.rotator.get_position()
-                
-                # Check if we've reached target
-                if abs(current_pos - target_position) <= position_tolerance:
-                    # Position reached, wait a bit more for stabilization
-                    time.sleep(0.1)
-                    
-                    # Apply settle time after movement completes, from field_rotation.yaml
-                    settle_time = self.fr_config['tracking']['settle_time_sec']
-                    if settle_time > 0:
-                        time.sleep(settle_time)
-                        
-                    logger.debug(f"[field-rot] Move successful: {current_pos_start:.6f}° → {current_pos:.6f}°")
-                    return True
-                
-                # Check for stalled movement
-                if abs(current_pos - last_pos) < 0.001:  # Less than 0.001° change
-                    stall_count += 1
-                    if stall_count > 20:  # 1 second of no movement (20 * 50ms)
-                        logger.warning(f"[field-rot] Rotator appears stalled at {current_pos:.6f}°, target was {target_position:.6f}°")
-                        return False
+            # Check for a stalled move - the rotator reports it has stopped (and isn't creeping) short of the target
+            # on two polls in a row, once it has had STALL_GRACE_SEC to get going
+            if stall_check:
+                if status.is_moving:
+                    stopped_at = None
+                elif (stopped_at is not None and abs(current_pos - stopped_at) < 0.001
+                      and monotonic_ns() >= stall_after_ns):
+                    logger.warning(f"[field-rot] Rotator appears stalled at {current_pos:.6f}°, target was {target_position:.6f}°")
+                    return 'stalled', current_pos
                 else:
-                    stall_count = 0
-                    
-                last_pos = current_pos
-                time.sleep(0.05)  # Check every 50ms
+                    stopped_at = current_pos
             
-            # Timeout - log the failure with more detail
-            final_pos = self.rotator.get_position()
-            actual_moved = abs(final_pos - current_pos_start)
-            logger.warning(f"[field-rot] Move timeout: target={target_position:.6f}°, start={current_pos_start:.6f}°, "
-                        f"final={final_pos:.6f}°, moved={actual_moved:.6f}° in {timeout_duration:.1f} s")
-            return False
+            # Progress logging every 10 seconds to avoid spam
+            now_ns = monotonic_ns()
+            if now_ns >= next_log_ns:
+                logger.debug("[field-rot] Move progress: at %.3f°, %.1f° to go",
+                             current_pos, abs(target_position - current_pos))
+                next_log_ns = now_ns + 10_000_000_000
             
-        except Exception as e:
-            logger.error(f"[field-rot] Tracking move execution failed: {e}")
+            if self._pause(next_poll_interval(abs(target_position - current_pos) - position_tolerance)):
+                return 'stopped', current_pos
+        
+        return 'timeout', current_pos
+
+    def next_poll_interval(self, remaining_deg: float) -> float:
+        """Seconds to wait before the next position poll with remaining_deg still to go - half the time the rotator
+        needs at full slew rate, so the interval halves on each wake as it closes in (clamped to 0.05 - 2 s)"""
+        return min(max(remaining_deg / self._slew_rate * 0.5, 0.05), 2.0)
+
+    def _pause(self, seconds: float) -> bool:
+        """Sleep between move polls. On the tracking thread the wait is on stop_event, so stop_tracking() doesn't
+        have to wait out a long move - returns True if tracking is being stopped"""
+        if threading.current_thread() is self.tracking_thread:
+            return self.stop_event.wait(seconds)
+        time.sleep(seconds)
+        return False
+
+    def _execute_move(self, target_position: float, start_position: Optional[float] = None, *, tolerance, timeout,
+                      poll_interval: float, stall_check: bool = False, label: str = "Tracking",
+                      timeout_level: int = logging.WARNING) -> bool:
+        """MoveAbsolute to target_position and wait for arrival - the primitive behind flip and tracking moves.
+        tolerance/timeout are values, or callables of the move distance. Settling is left to the caller's cooldown.
+        start_position: a position the caller has just read - saves a read before the move is commanded.
+        Transient HTTP errors are retried (see _retry_transient), anything else is raised to the caller"""
+        retry_transient = self._retry_transient
+        if start_position is None:
+            current_pos_start = retry_transient(self.rotator.read_status, False).position
+        else:
+            current_pos_start = start_position
+        move_distance = abs(target_position - current_pos_start)
+        position_tolerance = tolerance(move_distance) if callable(tolerance) else tolerance
+        timeout_duration = timeout(move_distance) if callable(timeout) else timeout
+        
+        logger.debug("[field-rot] %s move: %.3f° in max %.1fs", label, move_distance, timeout_duration)
+        
+        # Start the move via Alpaca function call (MoveAbsolute is idempotent, so safe to re-send)
+        retry_transient(self.rotator.rotator.MoveAbsolute, target_position)
+        self.rotator._last_pos = None  # drop the driver's cached pre-move read (see get_position(max_age=...))
+        
+        # Wait for completion using position-based checking
+        outcome, current_pos = self._wait_for_position(target_position, current_pos_start, position_tolerance,
+                                                       timeout_duration, poll_interval, stall_check)
+        if outcome == 'reached':
+            logger.debug("[field-rot] %s move successful: %.6f° → %.6f°", label, current_pos_start, current_pos)
+            return True
+        if outcome == 'stopped':
+            logger.info(f"[field-rot] Tracking stopped during {label.lower()} move (at {current_pos:.3f}°)")
             return False
-    
-    
-            
-            
-                
-    
\ No newline at end of file
+        if outcome == 'stalled':
+            return False
+        
+        # Timeout - log the failure with more detail
+        final_pos = retry_transient(self.rotator.read_status, False).position
+        logger.log(timeout_level, f"[field-rot] {label} move timeout after {timeout_duration:.1f} s: "
+                                  f"target={target_position:.6f}°, start={current_pos_start:.6f}°, final={final_pos:.6f}°, "
+                                  f"moved {abs(final_pos - current_pos_start):.3f}°, "
+                                  f"{abs(target_position - final_pos):.3f}° remaining")
+        return False
+
+    def _retry_transient(self, fn, *args):
+        """Call fn(*args), retrying dropped connections / HTTP timeouts after each of TRANSIENT_RETRY_DELAYS.
+        Other exceptions, and the final transient one, propagate to the caller"""
+        for delay in TRANSIENT_RETRY_DELAYS:
+            try:
+                return fn(*args)
+            except TRANSIENT_HTTP_ERRORS as e:
+                logger.warning(f"[field-rot] Transient rotator error ({type(e).__name__}), retrying in {delay:.1f} s")
+                if self._pause(delay):
+                    raise
+        return fn(*args)
+
+    def _execute_flip_move(self, target_position: float, start_position: Optional[float] = None) -> bool:
+        """Execute 180° flip move with position-based completion checking.
+        No settle wait - _execute_180_flip's post-flip cooldown (2 s) keeps tracking off the rotator while it settles"""
+        def flip_tolerance(distance):
+            return 1.0 if distance > 120.0 else 0.2     # Looser tolerance for big moves (definitely a flip)
+
+        def flip_timeout(distance):
+            # Extended timeout for 180° flips (from field_rotation.yaml), fallback for smaller moves
+            return self._flip_timeout if distance > 120.0 else max(15.0, distance / 2.0 + 5.0)
+
+        return self._execute_move(target_position, start_position, tolerance=flip_tolerance, timeout=flip_timeout,
+                                  poll_interval=0.5, label="Flip", timeout_level=logging.ERROR)
+
+    def _execute_tracking_move(self, target_position: float, start_position: Optional[float] = None) -> bool:
+        """Execute a tracking move with position-based completion.
+        Settling (0.1 s + settle_time_sec) is covered by the cooldown the caller sets after a successful move"""
+        return self._execute_move(
+            target_position, start_position,
+            tolerance=0.1,  # Must be larger than the rotator's positioning error
+            timeout=lambda distance: max(5.0, distance / 2.5 + 3.0),  # Conservative 2.5°/s estimate + overhead
+            poll_interval=0.2, stall_check=True, label="Tracking")
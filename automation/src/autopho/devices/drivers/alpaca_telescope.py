@@ -1,10 +1,12 @@
 import time
 import logging
 from typing import Tuple, Optional, Dict, Any
-from astropy.coordinates import SkyCoord
+from astropy.coordinates import SkyCoord, FK5
 from astropy.time import Time
 import astropy.units as u
 
+from ..alpaca_session import enable_keepalive
+
 try:
     from alpaca.telescope import Telescope
     ALPACA_AVAILABLE = True
@@ -14,6 +16,24 @@ except ImportError:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Catalogue frame for coordinate conversions (fixed, so built once) - the JNow frame comes from get_jnow_frame()
+FK5_J2000 = FK5(equinox='J2000')
+
+# (JNow frame, time.monotonic() it expires) - one tuple so concurrent callers never see a mismatched pair
+_jnow_cache = (None, 0.0)
+
+
+def get_jnow_frame(ttl: float = 1.0) -> FK5:
+    '''FK5 frame at the current equinox, reused for ttl seconds - precession over a second is < 0.05",
+    far below pointing accuracy, and this skips Time.now() on back-to-back slews/position reads'''
+    global _jnow_cache
+    frame, expiry = _jnow_cache
+    now = time.monotonic()
+    if frame is None or now >= expiry:
+        frame = FK5(equinox=Time.now())
+        _jnow_cache = (frame, now + ttl)
+    return frame
+
 class AlpacaTelescopeError(Exception):
     pass
 
@@ -24,6 +44,7 @@ class AlpacaTelescopeDriver:
         # Check if Alpyca installed
         if not ALPACA_AVAILABLE:
             raise AlpacaTelescopeError(f"Alpaca library not available. Please install.")
+        enable_keepalive()      # all Alpaca property calls share one keep-alive HTTP session
         
         self.telescope = None
         self.config = None
@@ -109,21 +130,27 @@ class AlpacaTelescopeDriver:
                 time.sleep(0.5)
                 
             # Convert J2000 coordinates to JNow coordinates
-            j2000 = SkyCoord(ra=ra_hours*u.hourangle, dec=dec_deg*u.deg, frame='fk5', equinox='J2000')
-            jnow = j2000.transform_to(SkyCoord(ra=ra_hours*u.hourangle, dec=dec_deg*u.deg, frame='fk5', equinox=Time.now()).frame)
+            j2000 = SkyCoord(ra=ra_hours*u.hourangle, dec=dec_deg*u.deg, frame=FK5_J2000)
+            jnow = j2000.transform_to(get_jnow_frame())
             
             # Don't initiate another move if the telescope is current slewing - wait for it to stop slewing first
-            while self.telescope.Slewing:
-                logger.debug(f"    Telescope is currently slewing - waiting for it to stop... {self.telescope.Slewing}...")
-                time.sleep(0.5)
+            slew_timeout = self.config.get('slew_timeout', 300.0)
+            if not self._wait_while(lambda: self.telescope.Slewing, timeout=slew_timeout):
+                logger.error(f"Telescope still slewing after {slew_timeout} s - not starting a new slew")
+                return False
             
             # Start the move via Alpaca function call
             self.telescope.SlewToCoordinatesAsync(jnow.ra.hour, jnow.dec.deg)
             # Log that the scope is slewing
             logger.info(f"Slewing telescope...")
-            while self.telescope.Slewing:
-                logger.debug(f"    Telescope Slewing?: {self.telescope.Slewing}...")
-                time.sleep(0.5)
+            if not self._wait_while(lambda: self.telescope.Slewing, timeout=slew_timeout):
+                logger.error(f"Slew did not complete within {slew_timeout} s - aborting")
+                # Best effort - a stuck mount must be stopped, not just left unwatched
+                try:
+                    self.telescope.AbortSlew()
+                except Exception as e:
+                    logger.error(f"Abort slew failed: {e}")
+                return False
             # Settle if necessary (time from devices.yaml)    
             settle_time = self.config.get('settle_time', 2.0)
             logger.info(f"Slew complete. Settling for {settle_time} s")
@@ -144,8 +171,8 @@ class AlpacaTelescopeDriver:
             ra_hours = self.telescope.RightAscension
             dec_deg = self.telescope.Declination
             # Convert coordinates from JNow to J2000 and return them (RA in decimal HOURS, Dec in decimal degrees)
-            jnow = SkyCoord(ra=ra_hours*u.hourangle, dec=dec_deg*u.deg, frame='fk5', equinox=Time.now())
-            j2000 = jnow.transform_to(SkyCoord(ra=ra_hours*u.hourangle, dec=dec_deg*u.deg, frame='fk5', equinox='J2000').frame)
+            jnow = SkyCoord(ra=ra_hours*u.hourangle, dec=dec_deg*u.deg, frame=get_jnow_frame())
+            j2000 = jnow.transform_to(FK5_J2000)
             return j2000.ra.hour, j2000.dec.deg
         except Exception as e:
             raise AlpacaTelescopeError(f"Failed to get coordinates: {e}")
@@ -212,9 +239,7 @@ class AlpacaTelescopeDriver:
         try:
             logger.info("Parking telescope...")
             self.telescope.Park()   # Alpaca function call
-            start = time.time()
-            while not self.is_parked() and (time.time() - start < max_wait):
-                time.sleep(0.1)
+            self._wait_while(lambda: not self.telescope.AtPark, timeout=max_wait)
             if self.is_parked():
                 logger.info("Telescope parked")
                 return True                
@@ -252,6 +277,21 @@ class AlpacaTelescopeDriver:
             logger.error(f"Abort slew failed: {e}")
             return False
         
+    def _wait_while(self, condition, timeout: Optional[float] = None, initial: float = 0.1, cap: float = 2.0,
+                    factor: float = 1.7) -> bool:
+        '''Poll condition() until it is False - quickly at first so short moves are seen to finish promptly, then
+        backing off (x factor up to cap seconds) so long slews don't flood the Alpaca server.
+        Returns True once condition() is False, or False if it is still True after timeout seconds'''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = initial
+        while condition():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            logger.debug("    Telescope still moving - next check in %.2f s", interval)
+            time.sleep(interval)
+            interval = min(interval * factor, cap)
+        return True
+        
     def apply_coordinate_correction(self, ra_offset_deg: float, dec_offset_deg: float):
         '''Apply coordinate corrections from the external platesolver where both RA and Dec offsets are provided in decimal degrees'''
         
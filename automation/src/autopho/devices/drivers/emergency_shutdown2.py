@@ -16,11 +16,12 @@ import psutil
 import os
 from typing import Optional, Dict, Any
 
-# Import your existing drivers (assuming they're in the same directory or Python path)
+# Import your existing drivers through the autopho package (they use package-relative imports for shared helpers)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))   # automation/src
 try:
-    from alpaca_telescope import AlpacaTelescopeDriver, AlpacaTelescopeError
-    from alpaca_rotator import AlpacaRotatorDriver, AlpacaRotatorError  
-    from alpaca_cover import AlpacaCoverDriver, AlpacaCoverError
+    from autopho.devices.drivers.alpaca_telescope import AlpacaTelescopeDriver, AlpacaTelescopeError
+    from autopho.devices.drivers.alpaca_rotator import AlpacaRotatorDriver, AlpacaRotatorError  
+    from autopho.devices.drivers.alpaca_cover import AlpacaCoverDriver, AlpacaCoverError
     DRIVERS_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Could not import drivers: {e}")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Simple test script for rotator flip mechanism
-Run this in the same folder as alpaca_rotator.py
+Run this script directly - it imports the rotator driver through the autopho package
 
 Test procedure:
 1. Run this script
@@ -10,9 +10,13 @@ Test procedure:
 4. Observe if 180° flip executes correctly
 """
 
+import sys
 import time
 import logging
-from alpaca_rotator import AlpacaRotatorDriver
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))   # automation/src
+from autopho.devices.drivers.alpaca_rotator import AlpacaRotatorDriver
 
 # Setup logging
 logging.basicConfig(
@@ -145,7 +149,7 @@ def main():
                     logger.info(f"Moving: {status_info.get('is_moving', 'unknown')}")
                     
                     # Check if we're in flip trigger zone
-                    if hasattr(rotator, 'field_tracker'):
+                    if rotator.field_tracker is not None:
                         wrap_needed = rotator.field_tracker.check_wrap_needed()
                         logger.info(f"Flip needed: {wrap_needed}")
                     
@@ -165,7 +169,7 @@ def main():
         if rotator:
             try:
                 logger.info("Stopping field rotation tracking...")
-                if hasattr(rotator, 'field_tracker'):
+                if rotator.field_tracker is not None:
                     rotator.stop_field_tracking()
                 
                 logger.info("Disconnecting rotator...")
@@ -79,7 +79,8 @@ class FocusFilterManager:
         skip_filter_change = False
         if skip_if_same:
             try:
-                current = self.filter_driver.get_current_filter_name()
+                # Fresh read - the wheel may have been moved by the GUI or another process since it was cached
+                current = self.filter_driver.get_current_filter_name(force_refresh=True)
                 current_code = None
                 if current and len(current) > 0:
                     # Extract code from filter name (e.g., "Sloan r'" -> 'R')
@@ -0,0 +1,17 @@
+'''Helpers for bringing devices up at the start of a run.
+Each Alpaca driver's connect() spends most of its time waiting on the device (connect settle sleeps, HTTP
+round-trips), so the independent ones can be started together and collected when each is needed.'''
+
+from concurrent.futures import Executor, Future
+from typing import Any, Dict, Optional
+
+
+def connect_in_background(executor: Executor, driver_cls, config: Optional[Dict[str, Any]]) -> Future:
+    '''Create driver_cls() and connect it with config on the executor.
+    The future resolves to (driver, connected) - connected is False if there is no config, and any exception
+    from the driver constructor or connect() is re-raised by future.result() so callers keep their except blocks'''
+    def _connect():
+        driver = driver_cls()
+        connected = bool(config) and driver.connect(config)
+        return driver, connected
+    return executor.submit(_connect)
@@ -418,7 +418,7 @@ class PlatesolveCorrector:
             # Suppress coord correction briefly after rotator move
             try:
                 last_rot = getattr(self.rotator_driver, "last_rotation_move_ts", 0.0)
-                if (time.time() - last_rot) < 0.8:
+                if (time.monotonic() - last_rot) < 0.8:
                     coordinate_correction_needed = False
                     logger.debug("Skipping RA/Dec correction (recent rotator move).")
             except Exception:
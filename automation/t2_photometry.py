@@ -5,6 +5,7 @@ import argparse
 from pathlib import Path
 from datetime import datetime, timezone
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -19,6 +20,7 @@ from autopho.devices.drivers.alpaca_rotator import AlpacaRotatorDriver, AlpacaRo
 from autopho.devices.drivers.alpaca_focuser import AlpacaFocuserDriver, AlpacaFocuserError
 from autopho.devices.focus_filter_manager import FocusFilterManager, FocusFilterManagerError
 from autopho.devices.camera import CameraManager, CameraError
+from autopho.devices.startup import connect_in_background
 from autopho.platesolving.corrector import PlatesolveCorrector, PlatesolveCorrectorError
 from autopho.imaging.session import ImagingSession, ImagingSessionError
 
@@ -401,13 +403,18 @@ def main():
                 logger.warning(f"Unexpected rotator error: {e} - continuing without")
                 rotator_driver = None
             
+            # Start the cover, focuser and filter wheel connections together - results are collected below as each is needed
+            with ThreadPoolExecutor(max_workers=3) as connect_pool:
+                cover_connect = connect_in_background(connect_pool, AlpacaCoverDriver, config_loader.get_cover_config())                 # from startup.py
+                focuser_connect = connect_in_background(connect_pool, AlpacaFocuserDriver, config_loader.get_focuser_config())           # from startup.py
+                filter_connect = connect_in_background(connect_pool, AlpacaFilterWheelDriver, config_loader.get_filter_wheel_config())   # from startup.py
+            
             # Set up cover connection
             cover_driver = None
             logger.info("Connecting to cover...")
             try:
-                cover_driver = AlpacaCoverDriver()                      # from alpaca_cover.py
-                cover_config = config_loader.get_cover_config()         # from loader.py
-                if cover_config and cover_driver.connect(cover_config): # from alpaca_cover.py
+                cover_driver, cover_connected = cover_connect.result()  # from alpaca_cover.py
+                if cover_connected:
                     cover_info = cover_driver.get_cover_info()
                     logger.info(f"Connected to: {cover_info.get('name', 'Unknown cover')} - State: {cover_info.get('cover_state', 'Unknown')}")
                 else:
@@ -428,9 +435,8 @@ def main():
             focuser_driver = None
             logger.info("Connecting to focuser...")
             try:
-                focuser_driver = AlpacaFocuserDriver()                          # from alpaca_focuser.py
-                focuser_config = config_loader.get_focuser_config()             # from loader.py
-                if focuser_config and focuser_driver.connect(focuser_config):   # from alpaca_focuser.py
+                focuser_driver, focuser_connected = focuser_connect.result()     # from alpaca_focuser.py
+                if focuser_connected:
                     focuser_info = focuser_driver.get_focuser_info()            # from alpaca_focuser.py
                     logger.info(f"Connected to focuser: {focuser_info.get('name', 'Unknown')}")
                     logger.info(f"    Current position: {focuser_info.get('position', 'Unknown')}")
@@ -449,10 +455,9 @@ def main():
             filter_driver = None
             logger.info("Connecting to filter wheel...")
             try:
-                filter_driver = AlpacaFilterWheelDriver()                   # from alpaca_filterwheel.py
-                filter_config = config_loader.get_filter_wheel_config()     # from loader.py
+                filter_driver, filter_connected = filter_connect.result()   # from alpaca_filterwheel.py
                 # Get and report filter information
-                if filter_config and filter_driver.connect(filter_config):  # from alpaca_filterwheel.py
+                if filter_connected:
                     filter_info = filter_driver.get_filter_info()           # from alpaca_filterwheel.py
                     logger.info(f"Connected to filter wheel: {filter_info.get('total_filters', 0)} filters")
                     logger.info(f"Filters: {filter_info.get('all_filters', [])}")
@@ -0,0 +1,81 @@
+"""
+Test script for the rotator move-wait stall detection (no rotator needed - simulated)
+Tests: a short tracking move whose driver raises IsMoving late is NOT reported as stalled,
+and a rotator that never moves IS reported as stalled (but only after the grace period)
+"""
+
+import sys
+import time
+import logging
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from autopho.devices.drivers.alpaca_rotator import FieldRotationTracker, RotatorStatus, STALL_GRACE_SEC
+
+
+class SimulatedRotator:
+    """Stands in for AlpacaRotatorDriver.read_status - sits still (IsMoving False) for lag_sec after creation,
+    i.e. after the MoveAbsolute, then slews to target at slew_rate deg/s. moves=False simulates a stuck rotator"""
+
+    def __init__(self, start, target, lag_sec, slew_rate=4.0, moves=True):
+        self.start, self.target, self.lag_sec, self.slew_rate, self.moves = start, target, lag_sec, slew_rate, moves
+        self.t0 = time.monotonic()
+
+    def read_status(self, moving=True):
+        elapsed = time.monotonic() - self.t0
+        position, is_moving = self.start, False
+        if self.moves and elapsed >= self.lag_sec:
+            travelled = (elapsed - self.lag_sec) * self.slew_rate
+            distance = abs(self.target - self.start)
+            step = min(travelled, distance)
+            position = self.start + step if self.target > self.start else self.start - step
+            is_moving = step < distance
+        return RotatorStatus(True, is_moving if moving else None, position, time.monotonic_ns())
+
+
+def make_tracker(rotator):
+    """Just the state _wait_for_position uses - skips __init__ (astropy/site setup isn't needed here)"""
+    tracker = FieldRotationTracker.__new__(FieldRotationTracker)
+    tracker.rotator = rotator
+    tracker.tracking_thread = None
+    tracker.stop_event = threading.Event()
+    tracker._slew_rate = 4.0
+    return tracker
+
+
+def test_lagging_is_moving(logger):
+    """0.5° tracking move, driver raises IsMoving 0.3 s after the command - must arrive, not stall"""
+    rotator = SimulatedRotator(start=200.0, target=200.5, lag_sec=0.3)
+    outcome, pos = make_tracker(rotator)._wait_for_position(200.5, 200.0, 0.1, 5.0, 0.2, stall_check=True)
+    if outcome == 'reached':
+        logger.info(f"✓ PASS: lagging IsMoving - move reached target ({pos:.3f}°)")
+        return True
+    logger.error(f"✗ FAIL: lagging IsMoving - outcome '{outcome}' at {pos:.3f}°, expected 'reached'")
+    return False
+
+
+def test_real_stall(logger):
+    """Rotator never moves - must be reported as stalled, but not before STALL_GRACE_SEC"""
+    rotator = SimulatedRotator(start=200.0, target=200.5, lag_sec=0.0, moves=False)
+    t0 = time.monotonic()
+    outcome, pos = make_tracker(rotator)._wait_for_position(200.5, 200.0, 0.1, 5.0, 0.2, stall_check=True)
+    elapsed = time.monotonic() - t0
+    if outcome == 'stalled' and STALL_GRACE_SEC <= elapsed < 5.0:
+        logger.info(f"✓ PASS: stuck rotator reported stalled after {elapsed:.2f} s")
+        return True
+    logger.error(f"✗ FAIL: stuck rotator - outcome '{outcome}' after {elapsed:.2f} s, "
+                 f"expected 'stalled' after at least {STALL_GRACE_SEC} s")
+    return False
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger(__name__)
+    results = [test_lagging_is_moving(logger), test_real_stall(logger)]
+    return 0 if all(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -67,7 +67,7 @@ def test_flip_trigger(rotator_driver, logger):
     logger.info("TEST 2: FLIP TRIGGER (Flip Margin)")
     logger.info("="*60)
     
-    if not hasattr(rotator_driver, 'field_tracker'):
+    if rotator_driver.field_tracker is None:
         logger.error("Field tracker not initialized - skipping flip trigger test")
         return False
     
@@ -113,7 +113,7 @@ def test_actual_flip(rotator_driver, logger):
     logger.info("TEST 3: ACTUAL 180° FLIP EXECUTION")
     logger.info("="*60)
     
-    if not hasattr(rotator_driver, 'field_tracker'):
+    if rotator_driver.field_tracker is None:
         logger.error("Field tracker not initialized - cannot test flip")
         return False
     
@@ -5,13 +5,13 @@ import logging
 from time import sleep
 
 
-driver_path = os.path.abspath(
-    os.path.join(__file__, "..", "..", "..", "src", "autopho", "devices", "drivers")
+src_path = os.path.abspath(
+    os.path.join(__file__, "..", "..", "..", "src")
 )
-if driver_path not in sys.path:
-    sys.path.insert(0, driver_path)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
-from alpaca_focuser import AlpacaFocuserDriver, AlpacaFocuserError
+from autopho.devices.drivers.alpaca_focuser import AlpacaFocuserDriver, AlpacaFocuserError
 
 logging.basicConfig(level=logging.DEBUG)
 logging.getLogger('urllib3.connectionpool').setLevel(logging.INFO)